@@ -9,23 +9,50 @@ import sys
 import json
 import time
 import logging
-import threading
-import subprocess
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, TYPE_CHECKING
 from dataclasses import dataclass
+from functools import cached_property
 from enum import Enum
 
+# subprocess and threading are imported where used so that read-only
+# commands (--status, --health) start without them
+if TYPE_CHECKING:
+    import threading
+
 # Add scripts directory to path for imports
 sys.path.append(str(Path(__file__).parent))
 
 # Import Agent Army components
 try:
     from monitoring_system import AgentArmyMonitor, MonitoringEvent, EventType, AlertSeverity
+    
+    # Alert severity raised for each overall health status
+    _STATUS_TO_SEVERITY = {
+        "failed": AlertSeverity.HIGH,
+        "degraded": AlertSeverity.MEDIUM,
+        "healthy": AlertSeverity.INFO,
+        "unknown": AlertSeverity.MEDIUM,
+    }
 except ImportError:
     print("Warning: Monitoring system not available")
     AgentArmyMonitor = None
+    _STATUS_TO_SEVERITY = {}
+
+# Prefer orjson for CLI output when it is installed
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS,
+            default=str
+        ).decode()
+except ImportError:
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2, default=str)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -46,7 +73,7 @@ class SystemComponent:
     name: str
     type: str  # "mcp", "agent", "hook", "service"
     status: ComponentStatus
-    last_check: datetime
+    last_check: int  # time.time_ns() of the check
     details: Dict[str, Any]
 
 class AgentArmyOrchestrator:
@@ -60,36 +87,50 @@ class AgentArmyOrchestrator:
         self.components: Dict[str, SystemComponent] = {}
         self.workflows: Dict[str, Any] = {}
         
+        # ISO timestamps are formatted lazily, only for components changed
+        # since the last health check
+        self._dirty_components: set = set()
+        self._last_check_iso: Dict[str, str] = {}
+        
+        # Health check cache, invalidated by any component write
+        self._components_version = 0
+        self._last_health_version = -1
+        self._health_cache: Dict[str, Any] = {}
+        
         # Monitoring integration
         self.monitor = AgentArmyMonitor() if AgentArmyMonitor else None
         
         # Thread management
         self.running = False
-        self.threads: List[threading.Thread] = []
-        
-        # Load configurations
-        self.load_configurations()
+        self.threads: List["threading.Thread"] = []
+        self._stop_event: Optional["threading.Event"] = None
+        
+    # Configurations are loaded on first access
+    @cached_property
+    def agent_registry(self) -> Dict:
+        """Agent registry"""
+        return self._load_json(self.claude_dir / "agents" / "agent-registry.json")
+        
+    @cached_property
+    def alert_config(self) -> Dict:
+        """Alerting config"""
+        return self._load_json(self.claude_dir / "config" / "alerting-config.json")
+        
+    @cached_property
+    def test_scenarios(self) -> Dict:
+        """Test scenarios"""
+        return self._load_json(self.claude_dir / "scripts" / "test-scenarios.json")
+        
+    @cached_property
+    def hook_config(self) -> Dict:
+        """Hook configuration from settings"""
+        return self._load_hook_config()
         
     def load_configurations(self):
-        """Load all system configurations"""
-        # Load agent registry
-        self.agent_registry = self._load_json(
-            self.claude_dir / "agents" / "agent-registry.json"
-        )
-        
-        # Load alerting config
-        self.alert_config = self._load_json(
-            self.claude_dir / "config" / "alerting-config.json"
-        )
-        
-        # Load test scenarios
-        self.test_scenarios = self._load_json(
-            self.claude_dir / "scripts" / "test-scenarios.json"
-        )
-        
-        # Load hook configuration from settings
-        self.hook_config = self._load_hook_config()
-        
+        """Drop loaded configurations so they are re-read on next access"""
+        for name in ("agent_registry", "alert_config", "test_scenarios", "hook_config"):
+            self.__dict__.pop(name, None)
+            
     def _load_json(self, path: Path) -> Dict:
         """Load JSON file safely"""
         if path.exists():
@@ -112,6 +153,35 @@ class AgentArmyOrchestrator:
                 logger.error(f"Failed to load hook config: {e}")
         return {}
         
+    @staticmethod
+    def _iso(ns: int) -> str:
+        """Format a time.time_ns() value as an ISO timestamp"""
+        return datetime.fromtimestamp(ns / 1e9).isoformat()
+        
+    def _set_component(self, name: str, component: SystemComponent):
+        """Record a component check result"""
+        self.components[name] = component
+        self._dirty_components.add(name)
+        self._components_version += 1
+        
+    def _emit(self, event_type: "EventType", severity: "AlertSeverity",
+              component: str, message: str, details: Dict[str, Any]):
+        """Send an event to the monitoring system"""
+        self.monitor.add_event(MonitoringEvent(
+            timestamp=datetime.now(),
+            event_type=event_type,
+            severity=severity,
+            component=component,
+            message=message,
+            details=details
+        ))
+        
+    def buffer_usage_pct(self) -> float:
+        """Fill level of the monitor's bounded event buffer, in percent"""
+        if not self.monitor or not self.monitor.events.maxlen:
+            return 0.0
+        return 100.0 * len(self.monitor.events) / self.monitor.events.maxlen
+        
     def initialize_system(self) -> bool:
         """Initialize all system components"""
         logger.info("Initializing Agent Army system...")
@@ -147,6 +217,7 @@ class AgentArmyOrchestrator:
     def validate_environment(self) -> bool:
         """Validate system environment"""
         logger.info("Validating environment...")
+        import subprocess
         
         try:
             result = subprocess.run(
@@ -157,22 +228,22 @@ class AgentArmyOrchestrator:
             )
             
             if result.returncode == 0:
-                self.components["environment"] = SystemComponent(
+                self._set_component("environment", SystemComponent(
                     name="environment",
                     type="service",
                     status=ComponentStatus.HEALTHY,
-                    last_check=datetime.now(),
+                    last_check=time.time_ns(),
                     details={"validation": "passed"}
-                )
+                ))
                 return True
             else:
-                self.components["environment"] = SystemComponent(
+                self._set_component("environment", SystemComponent(
                     name="environment",
                     type="service",
                     status=ComponentStatus.FAILED,
-                    last_check=datetime.now(),
+                    last_check=time.time_ns(),
                     details={"error": result.stderr}
-                )
+                ))
                 return False
                 
         except Exception as e:
@@ -182,46 +253,48 @@ class AgentArmyOrchestrator:
     def initialize_mcp_servers(self) -> bool:
         """Initialize and verify MCP servers"""
         logger.info("Initializing MCP servers...")
+        import subprocess
         
         try:
             # Check current MCP status
             result = subprocess.run(
                 ["claude", "mcp", "list"],
                 capture_output=True,
-                text=True,
                 timeout=15
             )
+            mcp_list = result.stdout.decode("utf-8", errors="replace")
             
             servers = ["workspace", "docs", "execution", "coord", "validation"]
             all_connected = True
             
             for server in servers:
-                if server in result.stdout:
-                    self.components[f"mcp_{server}"] = SystemComponent(
+                if server in mcp_list:
+                    self._set_component(f"mcp_{server}", SystemComponent(
                         name=f"mcp_{server}",
                         type="mcp",
                         status=ComponentStatus.HEALTHY,
-                        last_check=datetime.now(),
+                        last_check=time.time_ns(),
                         details={"connected": True}
-                    )
+                    ))
                 else:
                     all_connected = False
-                    self.components[f"mcp_{server}"] = SystemComponent(
+                    self._set_component(f"mcp_{server}", SystemComponent(
                         name=f"mcp_{server}",
                         type="mcp",
                         status=ComponentStatus.FAILED,
-                        last_check=datetime.now(),
+                        last_check=time.time_ns(),
                         details={"connected": False}
-                    )
+                    ))
                     
             if not all_connected:
                 logger.warning("Some MCP servers not connected, attempting registration...")
                 
                 # Try to register servers
+                # Only the exit code matters; stderr is kept for diagnostics
                 register_result = subprocess.run(
                     [str(self.claude_dir / "scripts" / "register-mcp-servers.sh")],
-                    capture_output=True,
-                    text=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
                     timeout=60
                 )
                 
@@ -229,7 +302,8 @@ class AgentArmyOrchestrator:
                     logger.info("MCP servers registered successfully")
                     return True
                 else:
-                    logger.error("Failed to register MCP servers")
+                    stderr = register_result.stderr.decode("utf-8", errors="replace").strip()
+                    logger.error(f"Failed to register MCP servers: {stderr}")
                     return False
                     
             return True
@@ -256,25 +330,25 @@ class AgentArmyOrchestrator:
         total_agents = self.agent_registry.get("total_agents", 0)
         
         if total_agents > 0:
-            self.components["agents"] = SystemComponent(
+            self._set_component("agents", SystemComponent(
                 name="agents",
                 type="agent",
                 status=ComponentStatus.HEALTHY,
-                last_check=datetime.now(),
+                last_check=time.time_ns(),
                 details={
                     "total_agents": total_agents,
                     "hierarchy_levels": len(self.agent_registry.get("hierarchy", {}))
                 }
-            )
+            ))
             return True
         else:
-            self.components["agents"] = SystemComponent(
+            self._set_component("agents", SystemComponent(
                 name="agents",
                 type="agent",
                 status=ComponentStatus.FAILED,
-                last_check=datetime.now(),
+                last_check=time.time_ns(),
                 details={"error": "No agents found"}
-            )
+            ))
             return False
             
     def initialize_hooks(self) -> bool:
@@ -283,37 +357,39 @@ class AgentArmyOrchestrator:
         
         hooks_dir = self.claude_dir / "hooks"
         
-        if not hooks_dir.exists():
+        # One directory read instead of a stat per hook
+        try:
+            with os.scandir(hooks_dir) as it:
+                entries = frozenset(entry.name for entry in it)
+        except (FileNotFoundError, NotADirectoryError):
             logger.error("Hooks directory not found")
             return False
             
         # Check for key hook scripts
         required_hooks = ["orchestrator.py", "communication-tracker.py"]
-        all_hooks_exist = True
+        missing = [hook for hook in required_hooks if hook not in entries]
+        all_hooks_exist = not missing
         
-        for hook in required_hooks:
-            hook_path = hooks_dir / hook
-            if not hook_path.exists():
-                all_hooks_exist = False
-                logger.error(f"Required hook missing: {hook}")
+        for hook in missing:
+            logger.error(f"Required hook missing: {hook}")
                 
         if all_hooks_exist and self.hook_config:
-            self.components["hooks"] = SystemComponent(
+            self._set_component("hooks", SystemComponent(
                 name="hooks",
                 type="hook",
                 status=ComponentStatus.HEALTHY,
-                last_check=datetime.now(),
+                last_check=time.time_ns(),
                 details={"hooks_configured": len(self.hook_config)}
-            )
+            ))
             return True
         else:
-            self.components["hooks"] = SystemComponent(
+            self._set_component("hooks", SystemComponent(
                 name="hooks",
                 type="hook",
                 status=ComponentStatus.DEGRADED if all_hooks_exist else ComponentStatus.FAILED,
-                last_check=datetime.now(),
+                last_check=time.time_ns(),
                 details={"error": "Hooks not properly configured"}
-            )
+            ))
             return False
             
     def execute_workflow(self, workflow_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -322,14 +398,13 @@ class AgentArmyOrchestrator:
         
         # Log workflow start
         if self.monitor:
-            self.monitor.add_event(MonitoringEvent(
-                timestamp=datetime.now(),
-                event_type=EventType.SYSTEM_HEALTH,
-                severity=AlertSeverity.INFO,
-                component="Orchestrator",
-                message=f"Starting workflow: {workflow_name}",
-                details=params
-            ))
+            self._emit(
+                EventType.SYSTEM_HEALTH,
+                AlertSeverity.INFO,
+                "Orchestrator",
+                f"Starting workflow: {workflow_name}",
+                params
+            )
             
         # Get workflow definition
         workflow = self.test_scenarios.get("test_scenarios", {}).get(workflow_name)
@@ -339,20 +414,26 @@ class AgentArmyOrchestrator:
             return {"success": False, "error": "Workflow not found"}
             
         # Execute workflow steps
+        workflow_steps = workflow.get("workflow_steps", [])
+        total_steps = len(workflow_steps)
         results = []
-        for step in workflow.get("workflow_steps", []):
+        success_count = 0
+        any_fail = False
+        for step in workflow_steps:
             step_result = self.execute_workflow_step(step, params)
             results.append(step_result)
             
             if not step_result.get("success"):
+                any_fail = True
                 logger.error(f"Workflow step failed: {step.get('step')}")
                 break
+            success_count += 1
                 
         return {
             "workflow": workflow_name,
-            "success": all(r.get("success") for r in results),
-            "steps_completed": len([r for r in results if r.get("success")]),
-            "total_steps": len(workflow.get("workflow_steps", [])),
+            "success": not any_fail,
+            "steps_completed": success_count,
+            "total_steps": total_steps,
             "results": results
         }
         
@@ -377,18 +458,26 @@ class AgentArmyOrchestrator:
         
     def health_check(self) -> Dict[str, Any]:
         """Perform system health check"""
+        if self._last_health_version == self._components_version:
+            return dict(self._health_cache, timestamp=datetime.now().isoformat())
+            
         health_status = {
             "timestamp": datetime.now().isoformat(),
             "overall_status": ComponentStatus.HEALTHY.value,
             "components": {}
         }
         
+        # Refresh ISO timestamps for components checked since last time
+        for name in self._dirty_components:
+            self._last_check_iso[name] = self._iso(self.components[name].last_check)
+        self._dirty_components.clear()
+        
         # Check each component
         for name, component in self.components.items():
             health_status["components"][name] = {
                 "type": component.type,
                 "status": component.status.value,
-                "last_check": component.last_check.isoformat(),
+                "last_check": self._last_check_iso[name],
                 "details": component.details
             }
             
@@ -398,6 +487,8 @@ class AgentArmyOrchestrator:
             elif component.status == ComponentStatus.DEGRADED and health_status["overall_status"] != ComponentStatus.FAILED.value:
                 health_status["overall_status"] = ComponentStatus.DEGRADED.value
                 
+        self._health_cache = health_status
+        self._last_health_version = self._components_version
         return health_status
         
     def monitor_system(self):
@@ -409,14 +500,13 @@ class AgentArmyOrchestrator:
                 
                 # Log health status
                 if self.monitor and health["overall_status"] != ComponentStatus.HEALTHY.value:
-                    self.monitor.add_event(MonitoringEvent(
-                        timestamp=datetime.now(),
-                        event_type=EventType.SYSTEM_HEALTH,
-                        severity=AlertSeverity.HIGH if health["overall_status"] == ComponentStatus.FAILED.value else AlertSeverity.MEDIUM,
-                        component="System",
-                        message=f"System health: {health['overall_status']}",
-                        details=health
-                    ))
+                    self._emit(
+                        EventType.SYSTEM_HEALTH,
+                        _STATUS_TO_SEVERITY[health["overall_status"]],
+                        "System",
+                        f"System health: {health['overall_status']}",
+                        health
+                    )
                     
                 # Re-check failed components
                 for name, component in self.components.items():
@@ -426,7 +516,8 @@ class AgentArmyOrchestrator:
             except Exception as e:
                 logger.error(f"Monitoring error: {e}")
                 
-            time.sleep(60)  # Check every minute
+            # Check every minute, waking immediately on stop
+            self._stop_event.wait(60)
             
     def attempt_component_recovery(self, component_name: str):
         """Attempt to recover a failed component"""
@@ -462,6 +553,8 @@ class AgentArmyOrchestrator:
             logger.error("System initialization failed")
             return
             
+        import threading
+        self._stop_event = threading.Event()
         self.running = True
         
         # Start monitoring thread
@@ -480,14 +573,18 @@ class AgentArmyOrchestrator:
         logger.info("Stopping Agent Army Orchestrator...")
         
         self.running = False
+        if self._stop_event:
+            self._stop_event.set()
         
         # Stop monitoring
         if self.monitor:
             self.monitor.stop_monitoring()
             
-        # Wait for threads
+        # Wait for threads against one shared deadline
+        deadline = time.monotonic() + 5
         for thread in self.threads:
-            thread.join(timeout=5)
+            thread.join(timeout=max(0, deadline - time.monotonic()))
+        self.threads.clear()
             
         logger.info("Agent Army Orchestrator stopped")
         
@@ -498,7 +595,8 @@ class AgentArmyOrchestrator:
             "health": self.health_check(),
             "active_workflows": len(self.workflows),
             "component_count": len(self.components),
-            "monitor_active": self.monitor.monitoring_active if self.monitor else False
+            "monitor_active": self.monitor.monitoring_active if self.monitor else False,
+            "event_buffer_usage_pct": self.buffer_usage_pct()
         }
 
 def main():
@@ -539,16 +637,16 @@ def main():
         
     elif args.status:
         status = orchestrator.status()
-        print(json.dumps(status, indent=2))
+        print(_dumps(status))
         
     elif args.health:
         health = orchestrator.health_check()
-        print(json.dumps(health, indent=2))
+        print(_dumps(health))
         
     elif args.workflow:
         # Execute workflow
         result = orchestrator.execute_workflow(args.workflow, {})
-        print(json.dumps(result, indent=2))
+        print(_dumps(result))
         
     else:
         parser.print_help()
@@ -4,14 +4,21 @@ Agent Workflow Engine
 Triggers agents to actually start working when tasks are assigned
 """
 
+import atexit
 import json
 import os
 import subprocess
 import sys
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
+# Add scripts directory to path for imports
+sys.path.append(str(Path(__file__).parent))
+
+from task_store import get_store
+
 class AgentWorkflowEngine:
     """Engine that triggers agents to start working on assigned tasks"""
     
@@ -22,6 +29,14 @@ class AgentWorkflowEngine:
         self.logs_dir = self.claude_dir / 'logs'
         self.logs_dir.mkdir(exist_ok=True)
         
+        # Shared tasks.json reader/writer
+        self.task_store = get_store(self.mcp_data / 'tasks.json')
+        
+        # Log file handle, kept open and reopened when the day changes
+        self._log_fh = None
+        self._log_day = None
+        atexit.register(self._close_log)
+        
         # Agent responsibility mapping
         self.agent_workflows = {
             'engineering-manager': self._tech_lead_workflow,
@@ -31,9 +46,34 @@ class AgentWorkflowEngine:
             'devops-engineer': self._devops_engineer_workflow,
             'scrum-master': self._scrum_master_workflow
         }
+        
+        # Task dispatch tables, checked in order (title keyword / task type)
+        self._tech_lead_dispatch = {
+            'setup': self._create_setup_plan,
+            'foundation': self._create_setup_plan,
+            'pbi': self._coordinate_feature_development,
+            'feature': self._coordinate_feature_development,
+            'user story': self._coordinate_feature_development
+        }
+        self._scrum_master_dispatch = {
+            'ceremony': self._coordinate_ceremony,
+            'development': self._coordinate_development_task
+        }
     
     def trigger_agent(self, agent_name: str, task_id: str, context: Dict = None) -> bool:
         """Trigger an agent to start working on a task"""
+        success = False
+        try:
+            with self.batch_task_writes():
+                success = self._trigger_agent(agent_name, task_id, context)
+        except (OSError, ValueError) as e:
+            # tasks.json is re-read before writing; pending updates are kept for the next flush
+            self._log(f"Error writing tasks: {str(e)}")
+            success = False
+        return success
+    
+    def _trigger_agent(self, agent_name: str, task_id: str, context: Dict = None) -> bool:
+        """Run the agent workflow for a task"""
         try:
             # Load task details
             task_data = self._load_task(task_id)
@@ -65,15 +105,13 @@ class AgentWorkflowEngine:
     def _tech_lead_workflow(self, task_id: str, task_data: Dict, context: Dict) -> bool:
         """Tech lead workflow - coordinate technical implementation"""
         try:
-            task_title = task_data.get('title', '')
+            title_lc = task_data.get('title', '').lower()
             
             # Create coordinated approach based on task type
-            if 'setup' in task_title.lower() or 'foundation' in task_title.lower():
-                return self._create_setup_plan(task_id, task_data)
-            elif any(keyword in task_title.lower() for keyword in ['pbi', 'feature', 'user story']):
-                return self._coordinate_feature_development(task_id, task_data)
-            else:
-                return self._default_tech_lead_coordination(task_id, task_data)
+            for keyword, handler in self._tech_lead_dispatch.items():
+                if keyword in title_lc:
+                    return handler(task_id, task_data)
+            return self._default_tech_lead_coordination(task_id, task_data)
                 
         except Exception as e:
             self._log(f"Tech lead workflow error: {str(e)}")
@@ -150,13 +188,8 @@ class AgentWorkflowEngine:
             
             # Based on task type, coordinate different activities
             task_type = task_data.get('context', {}).get('type', '')
-            
-            if task_type == 'ceremony':
-                return self._coordinate_ceremony(task_id, task_data)
-            elif task_type == 'development':
-                return self._coordinate_development_task(task_id, task_data)
-            else:
-                return self._default_scrum_coordination(task_id, task_data)
+            handler = self._scrum_master_dispatch.get(task_type, self._default_scrum_coordination)
+            return handler(task_id, task_data)
                 
         except Exception as e:
             self._log(f"Scrum master workflow error: {str(e)}")
@@ -254,70 +287,88 @@ class AgentWorkflowEngine:
     
     # Utility methods
     
+    @contextmanager
+    def batch_task_writes(self):
+        """Defer tasks.json writes and flush them once on exit"""
+        with self.task_store.batch():
+            yield
+    
     def _load_task(self, task_id: str) -> Optional[Dict]:
         """Load task data from JSON file"""
         try:
-            tasks_file = self.mcp_data / 'tasks.json'
-            if not tasks_file.exists():
+            tasks = self.task_store.load()
+            if tasks is None:
                 return None
             
-            with open(tasks_file, 'r') as f:
-                tasks = json.load(f)
-            
             return tasks.get(task_id)
-        except Exception:
+        except (OSError, json.JSONDecodeError) as e:
+            self._log(f"tasks.json read failed: {e!r}")
             return None
     
     def _update_task_status(self, task_id: str, status: str):
         """Update task status"""
         try:
-            tasks_file = self.mcp_data / 'tasks.json'
-            if not tasks_file.exists():
-                return
-            
-            with open(tasks_file, 'r') as f:
-                tasks = json.load(f)
-            
-            if task_id in tasks:
-                tasks[task_id]['status'] = status
-                tasks[task_id]['updated_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')
-                
-                with open(tasks_file, 'w') as f:
-                    json.dump(tasks, f, indent=2)
-        except Exception as e:
+            self.task_store.update(task_id, status=status)
+        except (OSError, json.JSONDecodeError) as e:
             self._log(f"Error updating task status: {str(e)}")
     
     def _assign_task_to_agent(self, task_id: str, agent_name: str):
         """Assign task to specific agent"""
         try:
-            tasks_file = self.mcp_data / 'tasks.json'
-            if not tasks_file.exists():
-                return
-            
-            with open(tasks_file, 'r') as f:
-                tasks = json.load(f)
-            
-            if task_id in tasks:
-                tasks[task_id]['assigned_to'] = agent_name
-                tasks[task_id]['updated_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')
-                
-                with open(tasks_file, 'w') as f:
-                    json.dump(tasks, f, indent=2)
-        except Exception as e:
+            self.task_store.update(task_id, assigned_to=agent_name)
+        except (OSError, json.JSONDecodeError) as e:
             self._log(f"Error assigning task: {str(e)}")
     
     def _log(self, message: str):
         """Log message to file"""
-        log_file = self.logs_dir / f"workflow-engine-{datetime.now().strftime('%Y%m%d')}.log"
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        now = datetime.now()
+        day = now.strftime('%Y%m%d')
+        timestamp = now.strftime('%Y-%m-%d %H:%M:%S')
         
-        with open(log_file, 'a') as f:
-            f.write(f"{timestamp} - {message}\n")
+        if day != self._log_day:
+            self._close_log()
+            log_file = self.logs_dir / f"workflow-engine-{day}.log"
+            self._log_fh = open(log_file, 'a')
+            self._log_day = day
+        
+        self._log_fh.write(f"{timestamp} - {message}\n")
+        self._log_fh.flush()
+    
+    def _close_log(self):
+        """Close the log file handle"""
+        if self._log_fh:
+            self._log_fh.close()
+            self._log_fh = None
+            self._log_day = None
+
+def serve():
+    """Long-lived worker: one JSON request per stdin line, one result per stdout line"""
+    engine = AgentWorkflowEngine()
+    
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+            success = engine.trigger_agent(
+                request['agent'], request['task_id'], request.get('context', {})
+            )
+            response = {"success": success}
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            response = {"success": False, "error": f"Invalid request: {e!r}"}
+        
+        sys.stdout.write(json.dumps(response) + '\n')
+        sys.stdout.flush()
 
 def main():
     """CLI interface for the workflow engine"""
+    if '--serve' in sys.argv[1:]:
+        serve()
+        return
+    
     if len(sys.argv) < 3:
-        print("Usage: python agent_workflow_engine.py <agent_name> <task_id>")
+        print("Usage: python agent_workflow_engine.py <agent_name> <task_id> [context_json]")
+        print("       python agent_workflow_engine.py --serve")
         sys.exit(1)
     
     agent_name = sys.argv[1]
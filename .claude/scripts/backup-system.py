@@ -4,32 +4,152 @@ Agent Army Automated Backup System
 Creates comprehensive backups of the entire Agent Army infrastructure
 """
 
+import io
 import os
+import queue
+import re
 import sys
 import shutil
 import tarfile
 import datetime
 import argparse
+import fnmatch
 import json
 import subprocess
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from typing import List, Dict, Optional
 
 class AgentArmyBackup:
     """Comprehensive backup system for Agent Army"""
     
-    def __init__(self, project_root: Optional[Path] = None):
+    # Files and directories never included in backups
+    _EXCLUDE_NAMES = frozenset({
+        "__pycache__",
+        ".DS_Store",
+        "Thumbs.db",
+        "venv",
+        "node_modules"
+    })
+    _EXCLUDE_NAME_RE = re.compile("|".join(
+        fnmatch.translate(pattern) for pattern in ("*.pyc", "*.pyo", "*.tmp", "*.temp")
+    ))
+    
+    # Per-file copy buffer for tar.add (tarfile defaults to 16 KiB)
+    COPY_BUFSIZE = 1 << 20
+    
+    # Full backups read up to this many files ahead of the compressor,
+    # buffering those no larger than PREFETCH_MAX_SIZE in memory
+    PREFETCH_DEPTH = 8
+    PREFETCH_MAX_SIZE = 8 << 20
+    
+    # Per-file progress lines are written to stdout in batches of this size
+    REPORT_BATCH = 256
+    
+    # Every extension a backup archive may carry
+    _ARCHIVE_SUFFIXES = (".tar.gz", ".tar.zst", ".tar")
+    
+    # Archive extension per compressor
+    ARCHIVE_EXTENSIONS = {
+        "pigz": ".tar.gz",
+        "gzip": ".tar.gz",
+        "zstd": ".tar.zst",
+        "none": ".tar"
+    }
+    
+    def __init__(self, project_root: Optional[Path] = None, compressor: Optional[str] = None,
+                 verbose: bool = True, compress_threads: Optional[int] = None):
         self.project_root = project_root or Path.cwd()
         self.claude_dir = self.project_root / ".claude"
         self.backup_dir = self.project_root / "backups"
         self.timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         
+        # Archive names are sliced off absolute paths below the project root
+        self._root_str = str(self.project_root).rstrip(os.sep)
+        self._root_len = len(self._root_str) + 1
+        
         # Ensure backup directory exists
         self.backup_dir.mkdir(exist_ok=True)
         
+        # Compressor: pigz when installed, otherwise in-process gzip
+        self.compressor = self._resolve_compressor(compressor)
+        self.archive_ext = self.ARCHIVE_EXTENSIONS[self.compressor]
+        
+        # Threads for pigz/zstd; process pool workers split the cores between them
+        self.compress_threads = compress_threads or os.cpu_count() or 1
+        
+        # Per-file progress output (off with --quiet)
+        self.verbose = verbose
+        
+        # Built on first use by get_critical_files()
+        self._critical_files: Optional[Dict[str, List[str]]] = None
+        
+    @staticmethod
+    def _resolve_compressor(compressor: Optional[str]) -> str:
+        """Pick the compressor, falling back to gzip if a tool is missing"""
+        if compressor is None:
+            return "pigz" if shutil.which("pigz") else "gzip"
+        if compressor in ("pigz", "zstd") and not shutil.which(compressor):
+            print(f"⚠️  {compressor} not found, using gzip")
+            return "gzip"
+        return compressor
+        
+    def _compressor_cmd(self) -> Optional[List[str]]:
+        """External compressor command reading stdin, or None for in-process"""
+        if self.compressor == "pigz":
+            return ["pigz", "-c", "-p", str(self.compress_threads)]
+        if self.compressor == "zstd":
+            return ["zstd", f"-T{self.compress_threads}", "-3", "-c"]
+        return None
+        
+    @contextmanager
+    def _open_tar(self, backup_path: Path):
+        """Open a backup archive for writing with the configured compressor"""
+        cmd = self._compressor_cmd()
+        if not cmd:
+            if self.compressor == "none":
+                tar = tarfile.open(backup_path, "w")
+            else:
+                # Level 1 is several times faster than the default 9
+                tar = tarfile.open(backup_path, "w:gz", compresslevel=1)
+            with tar:
+                tar.copybufsize = self.COPY_BUFSIZE
+                yield tar
+            return
+            
+        with open(backup_path, "wb") as out:
+            proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=out)
+            try:
+                with tarfile.open(fileobj=proc.stdin, mode="w|") as tar:
+                    tar.copybufsize = self.COPY_BUFSIZE
+                    yield tar
+            finally:
+                proc.stdin.close()
+                proc.wait()
+                
+        if proc.returncode != 0:
+            raise OSError(f"{cmd[0]} exited with status {proc.returncode}")
+            
+    def _scandir_rec(self, path):
+        """Yield DirEntry objects for all non-directory entries below path"""
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    # Prune excluded trees without reading them
+                    if entry.name in self._EXCLUDE_NAMES:
+                        continue
+                    yield from self._scandir_rec(entry.path)
+                else:
+                    yield entry
+                    
     def get_critical_files(self) -> Dict[str, List[str]]:
         """Define critical files and directories for backup"""
-        return {
+        if self._critical_files is not None:
+            return self._critical_files
+            
+        self._critical_files = {
             "agents": [
                 ".claude/agents/",
                 ".claude/agents/agent-registry.json"
@@ -59,6 +179,7 @@ class AgentArmyBackup:
                 ".claude/config-backup.json"
             ]
         }
+        return self._critical_files
         
     def create_component_backup(self, component: str) -> Optional[Path]:
         """Create backup for specific component"""
@@ -68,30 +189,36 @@ class AgentArmyBackup:
             print(f"❌ Unknown component: {component}")
             return None
             
-        backup_name = f"agent-army-{component}-{self.timestamp}.tar.gz"
+        backup_name = f"agent-army-{component}-{self.timestamp}{self.archive_ext}"
         backup_path = self.backup_dir / backup_name
         
         print(f"📦 Creating {component} backup...")
         
         try:
-            with tarfile.open(backup_path, "w:gz") as tar:
+            with self._open_tar(backup_path) as tar:
+                # Hoist lookups out of the per-file loop
+                add = tar.add
+                keep = self._should_include_file
+                root_len = self._root_len
+                
                 for file_path in critical_files[component]:
                     full_path = self.project_root / file_path
                     
                     if full_path.exists():
                         if full_path.is_dir():
                             # Add directory recursively, excluding certain files
-                            for item in full_path.rglob("*"):
-                                if self._should_include_file(item):
-                                    arcname = item.relative_to(self.project_root)
-                                    tar.add(item, arcname=arcname)
+                            for entry in self._scandir_rec(full_path):
+                                path = entry.path
+                                if keep(path):
+                                    add(path, arcname=path[root_len:])
                         else:
                             # Add individual file
-                            arcname = full_path.relative_to(self.project_root)
-                            tar.add(full_path, arcname=arcname)
+                            path = str(full_path)
+                            add(path, arcname=path[root_len:])
                         
-                        print(f"  ✅ Added: {file_path}")
-                    else:
+                        if self.verbose:
+                            print(f"  ✅ Added: {file_path}")
+                    elif self.verbose:
                         print(f"  ⚠️  Skipped (not found): {file_path}")
                         
         except Exception as e:
@@ -103,67 +230,149 @@ class AgentArmyBackup:
         
     def create_full_backup(self) -> Optional[Path]:
         """Create complete system backup"""
-        backup_name = f"agent-army-full-{self.timestamp}.tar.gz"
+        backup_name = f"agent-army-full-{self.timestamp}{self.archive_ext}"
         backup_path = self.backup_dir / backup_name
         
         print(f"📦 Creating full system backup...")
+        file_count = 0
         
         try:
-            with tarfile.open(backup_path, "w:gz") as tar:
-                critical_files = self.get_critical_files()
+            with self._open_tar(backup_path) as tar:
+                addfile = tar.addfile
                 
-                # Add all components
-                for component, file_paths in critical_files.items():
-                    print(f"  📂 Processing {component}...")
-                    
-                    for file_path in file_paths:
-                        full_path = self.project_root / file_path
-                        
-                        if full_path.exists():
-                            if full_path.is_dir():
-                                # Add directory recursively
-                                for item in full_path.rglob("*"):
-                                    if self._should_include_file(item):
-                                        arcname = item.relative_to(self.project_root)
-                                        tar.add(item, arcname=arcname)
-                            else:
-                                # Add individual file
-                                arcname = full_path.relative_to(self.project_root)
-                                tar.add(full_path, arcname=arcname)
-                                
-                            print(f"    ✅ {file_path}")
-                        else:
-                            print(f"    ⚠️  {file_path} (not found)")
+                # Files are read on a background thread while the previous one compresses
+                for tarinfo, fileobj in self._prefetch(tar, self._iter_full_backup_files()):
+                    addfile(tarinfo, fileobj)
+                    if fileobj:
+                        fileobj.close()
+                    file_count += 1
                             
         except Exception as e:
             print(f"❌ Error creating full backup: {e}")
             return None
             
         # Create backup manifest
-        self._create_backup_manifest(backup_path)
+        self._create_backup_manifest(backup_path, file_count)
         
         print(f"✅ Full backup created: {backup_path}")
         return backup_path
         
+    def _iter_full_backup_files(self):
+        """Yield (path, arcname) for every file in a full backup"""
+        critical_files = self.get_critical_files()
+        
+        # Hoist lookups out of the per-file loop
+        keep = self._should_include_file
+        root_len = self._root_len
+        
+        # Add all components
+        for component, file_paths in critical_files.items():
+            print(f"  📂 Processing {component}...")
+            
+            for file_path in file_paths:
+                full_path = self.project_root / file_path
+                
+                if full_path.exists():
+                    if full_path.is_dir():
+                        # Add directory recursively
+                        for entry in self._scandir_rec(full_path):
+                            path = entry.path
+                            if keep(path):
+                                yield path, path[root_len:]
+                    else:
+                        # Add individual file
+                        path = str(full_path)
+                        yield path, path[root_len:]
+                        
+                    if self.verbose:
+                        print(f"    ✅ {file_path}")
+                elif self.verbose:
+                    print(f"    ⚠️  {file_path} (not found)")
+                    
+    def _read_ahead(self, path: str, size: int):
+        """Read a file into memory, hinting the kernel to drop it afterwards"""
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            with os.fdopen(fd, "rb", closefd=False) as f:
+                data = f.read(size)
+            if hasattr(os, "posix_fadvise"):
+                # Backups read each file once; don't evict the working set for them
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+        return io.BytesIO(data)
+        
+    def _prefetch(self, tar: tarfile.TarFile, items):
+        """Yield (tarinfo, fileobj) for (path, arcname) items, reading ahead on a thread"""
+        done = object()
+        q = queue.Queue(maxsize=self.PREFETCH_DEPTH)
+        stop = threading.Event()
+        
+        def reader():
+            try:
+                for path, arcname in items:
+                    if stop.is_set():
+                        return
+                    tarinfo = tar.gettarinfo(path, arcname)
+                    if tarinfo is None:
+                        # Sockets and other unarchivable types
+                        continue
+                    fileobj = None
+                    if tarinfo.isreg():
+                        if tarinfo.size <= self.PREFETCH_MAX_SIZE:
+                            fileobj = self._read_ahead(path, tarinfo.size)
+                            tarinfo.size = len(fileobj.getbuffer())
+                        else:
+                            # Stream large files on the writer side instead of buffering them
+                            fileobj = open(path, "rb")
+                    q.put((tarinfo, fileobj))
+            except BaseException as e:
+                q.put(e)
+            finally:
+                q.put(done)
+                
+        thread = threading.Thread(target=reader, name="backup-prefetch", daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = q.get()
+                if item is done:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            # Unblock and retire the reader if the consumer stopped early
+            stop.set()
+            while thread.is_alive():
+                try:
+                    item = q.get(timeout=0.05)
+                except queue.Empty:
+                    continue
+                if isinstance(item, tuple) and item[1]:
+                    item[1].close()
+            thread.join()
+            
     def create_incremental_backup(self) -> Optional[Path]:
         """Create incremental backup of changed files"""
-        backup_name = f"agent-army-incremental-{self.timestamp}.tar.gz"
+        backup_name = f"agent-army-incremental-{self.timestamp}{self.archive_ext}"
         backup_path = self.backup_dir / backup_name
         
         print(f"📦 Creating incremental backup...")
         
-        # Get changed files using git
+        # Get changed files using git (NUL-separated, safe for any file name)
         try:
             result = subprocess.run([
-                "git", "diff", "--name-only", "HEAD~1", "HEAD"
+                "git", "diff", "--name-only", "-z", "HEAD~1", "HEAD"
             ], capture_output=True, text=True, cwd=self.project_root)
             
             if result.returncode != 0:
                 print("⚠️  Git not available or no changes, creating modified files backup")
                 return self._create_modified_files_backup()
                 
-            changed_files = result.stdout.strip().split('\n')
-            changed_files = [f for f in changed_files if f.strip()]
+            changed_files = [f for f in result.stdout.split('\0') if f.strip()]
             
             if not changed_files:
                 print("ℹ️  No changes detected")
@@ -173,14 +382,22 @@ class AgentArmyBackup:
             print(f"⚠️  Error detecting changes: {e}")
             return self._create_modified_files_backup()
             
+        changed_files = [
+            f for f in changed_files
+            if (self.project_root / f).exists() and self._should_include_file(f)
+        ]
+        
         try:
-            with tarfile.open(backup_path, "w:gz") as tar:
-                for file_path in changed_files:
-                    full_path = self.project_root / file_path
-                    
-                    if full_path.exists() and self._should_include_file(full_path):
-                        tar.add(full_path, arcname=file_path)
-                        print(f"  ✅ {file_path}")
+            if shutil.which("tar"):
+                # Let the tar binary read the files itself
+                self._tar_file_list(backup_path, changed_files)
+            else:
+                with self._open_tar(backup_path) as tar:
+                    for file_path in changed_files:
+                        tar.add(self.project_root / file_path, arcname=file_path)
+                        
+            if self.verbose:
+                sys.stdout.write("".join(f"  ✅ {file_path}\n" for file_path in changed_files))
                         
         except Exception as e:
             print(f"❌ Error creating incremental backup: {e}")
@@ -189,33 +406,69 @@ class AgentArmyBackup:
         print(f"✅ Incremental backup created: {backup_path}")
         return backup_path
         
+    def _tar_file_list(self, backup_path: Path, files: List[str]):
+        """Archive project-relative paths with the system tar and configured compressor"""
+        file_list = b"\0".join(os.fsencode(f) for f in files)
+        tar_cmd = ["tar", "-C", str(self.project_root), "--null", "-T", "-"]
+        cmd = self._compressor_cmd()
+        
+        with open(backup_path, "wb") as out:
+            if cmd:
+                tar = subprocess.Popen(tar_cmd + ["-cf", "-"], stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+                compress = subprocess.Popen(cmd, stdin=tar.stdout, stdout=out)
+                tar.stdout.close()
+            else:
+                mode = "-cf" if self.compressor == "none" else "-czf"
+                tar = subprocess.Popen(tar_cmd + [mode, "-"], stdin=subprocess.PIPE, stdout=out)
+                compress = None
+                
+            tar.stdin.write(file_list)
+            tar.stdin.close()
+            tar.wait()
+            if compress:
+                compress.wait()
+                
+        if tar.returncode != 0:
+            raise OSError(f"tar exited with status {tar.returncode}")
+        if compress and compress.returncode != 0:
+            raise OSError(f"{cmd[0]} exited with status {compress.returncode}")
+            
     def _create_modified_files_backup(self) -> Optional[Path]:
         """Create backup of recently modified files"""
-        backup_name = f"agent-army-modified-{self.timestamp}.tar.gz"
+        backup_name = f"agent-army-modified-{self.timestamp}{self.archive_ext}"
         backup_path = self.backup_dir / backup_name
         
         # Find files modified in last 24 hours
-        cutoff_time = datetime.datetime.now() - datetime.timedelta(hours=24)
+        cutoff = (datetime.datetime.now() - datetime.timedelta(hours=24)).timestamp()
         modified_files = []
         
-        for root, dirs, files in os.walk(self.claude_dir):
-            for file in files:
-                file_path = Path(root) / file
-                
-                if file_path.stat().st_mtime > cutoff_time.timestamp():
-                    if self._should_include_file(file_path):
-                        modified_files.append(file_path)
+        keep = self._should_include_file
+        append = modified_files.append
+        for entry in self._scandir_rec(self.claude_dir):
+            if entry.stat(follow_symlinks=False).st_mtime > cutoff:
+                if keep(entry.path):
+                    append(entry.path)
                         
         if not modified_files:
             print("ℹ️  No recently modified files found")
             return None
             
         try:
-            with tarfile.open(backup_path, "w:gz") as tar:
-                for file_path in modified_files:
-                    arcname = file_path.relative_to(self.project_root)
-                    tar.add(file_path, arcname=arcname)
-                    print(f"  ✅ {arcname}")
+            with self._open_tar(backup_path) as tar:
+                add = tar.add
+                root_len = self._root_len
+                buf = io.StringIO() if self.verbose else None
+                for i, file_path in enumerate(modified_files, 1):
+                    arcname = file_path[root_len:]
+                    add(file_path, arcname=arcname)
+                    if buf:
+                        buf.write(f"  ✅ {arcname}\n")
+                        if i % self.REPORT_BATCH == 0:
+                            sys.stdout.write(buf.getvalue())
+                            buf.seek(0)
+                            buf.truncate()
+                if buf:
+                    sys.stdout.write(buf.getvalue())
                     
         except Exception as e:
             print(f"❌ Error creating modified files backup: {e}")
@@ -223,29 +476,16 @@ class AgentArmyBackup:
             
         return backup_path
         
-    def _should_include_file(self, file_path: Path) -> bool:
+    def _should_include_file(self, file_path) -> bool:
         """Determine if file should be included in backup"""
-        exclude_patterns = [
-            "__pycache__",
-            "*.pyc",
-            "*.pyo",
-            ".DS_Store",
-            "Thumbs.db",
-            "venv",
-            "node_modules",
-            "*.tmp",
-            "*.temp"
-        ]
+        parts = os.fspath(file_path).split(os.sep)
         
-        file_str = str(file_path)
-        
-        for pattern in exclude_patterns:
-            if pattern in file_str:
-                return False
-                
-        return True
+        if not self._EXCLUDE_NAMES.isdisjoint(parts):
+            return False
+            
+        return not self._EXCLUDE_NAME_RE.match(parts[-1])
         
-    def _create_backup_manifest(self, backup_path: Path):
+    def _create_backup_manifest(self, backup_path: Path, file_count: int):
         """Create manifest file with backup details"""
         manifest = {
             "backup_name": backup_path.name,
@@ -253,24 +493,25 @@ class AgentArmyBackup:
             "type": "full",
             "project_root": str(self.project_root),
             "components": list(self.get_critical_files().keys()),
-            "file_count": 0,
+            "file_count": file_count,
             "size_mb": round(backup_path.stat().st_size / (1024 * 1024), 2)
         }
         
-        # Count files in backup
-        try:
-            with tarfile.open(backup_path, "r:gz") as tar:
-                manifest["file_count"] = len(tar.getnames())
-        except:
-            pass
-            
-        manifest_path = backup_path.with_suffix('.json')
+        # Append to the full name: with_suffix would map .tar.gz/.tar.zst/.tar alike to .tar.json
+        manifest_path = backup_path.with_name(backup_path.name + '.json')
         with open(manifest_path, 'w') as f:
             json.dump(manifest, f, indent=2)
             
+    def _iter_backups(self):
+        """Yield DirEntry objects for backup archives"""
+        with os.scandir(self.backup_dir) as it:
+            for entry in it:
+                if entry.name.endswith(self._ARCHIVE_SUFFIXES) and entry.is_file():
+                    yield entry
+                    
     def list_backups(self):
         """List all available backups"""
-        backups = list(self.backup_dir.glob("*.tar.gz"))
+        backups = list(self._iter_backups())
         
         if not backups:
             print("ℹ️  No backups found")
@@ -279,9 +520,11 @@ class AgentArmyBackup:
         print(f"📁 Available backups ({len(backups)}):")
         print("-" * 50)
         
+        # DirEntry.stat() is cached, so each backup is stat'ed once
         for backup in sorted(backups, key=lambda x: x.stat().st_mtime, reverse=True):
-            size_mb = round(backup.stat().st_size / (1024 * 1024), 2)
-            modified = datetime.datetime.fromtimestamp(backup.stat().st_mtime)
+            st = backup.stat()
+            size_mb = round(st.st_size / (1024 * 1024), 2)
+            modified = datetime.datetime.fromtimestamp(st.st_mtime)
             
             print(f"  📦 {backup.name}")
             print(f"     Size: {size_mb} MB")
@@ -290,7 +533,7 @@ class AgentArmyBackup:
             
     def cleanup_old_backups(self, keep_count: int = 10):
         """Remove old backup files, keeping the most recent ones"""
-        backups = list(self.backup_dir.glob("*.tar.gz"))
+        backups = list(self._iter_backups())
         
         if len(backups) <= keep_count:
             print(f"ℹ️  Only {len(backups)} backups found, no cleanup needed")
@@ -304,9 +547,9 @@ class AgentArmyBackup:
         
         for backup in old_backups:
             try:
-                backup.unlink()
+                os.unlink(backup.path)
                 # Also remove manifest if it exists
-                manifest = backup.with_suffix('.json')
+                manifest = Path(backup.path + '.json')
                 if manifest.exists():
                     manifest.unlink()
                 print(f"  ✅ Removed: {backup.name}")
@@ -321,17 +564,17 @@ class AgentArmyBackup:
             # Add all critical files to git
             result = subprocess.run([
                 "git", "add", ".claude/", "README.md"
-            ], capture_output=True, text=True, cwd=self.project_root)
+            ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=False, cwd=self.project_root)
             
             if result.returncode != 0:
-                print(f"❌ Git add failed: {result.stderr}")
+                print(f"❌ Git add failed: {result.stderr.decode(errors='replace')}")
                 return False
                 
             # Commit changes
             commit_msg = f"backup: Agent Army configuration {self.timestamp}"
             result = subprocess.run([
                 "git", "commit", "-m", commit_msg
-            ], capture_output=True, text=True, cwd=self.project_root)
+            ], capture_output=True, text=True, check=False, cwd=self.project_root)
             
             if result.returncode != 0:
                 if "nothing to commit" in result.stdout:
@@ -343,10 +586,10 @@ class AgentArmyBackup:
                     
             print("✅ Git backup committed")
             
-            # Push to remote if configured
+            # Push to remote if configured (only the exit status is used)
             result = subprocess.run([
                 "git", "push"
-            ], capture_output=True, text=True, cwd=self.project_root)
+            ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False, cwd=self.project_root)
             
             if result.returncode == 0:
                 print("✅ Git backup pushed to remote")
@@ -359,6 +602,13 @@ class AgentArmyBackup:
             print(f"❌ Git backup failed: {e}")
             return False
 
+def _backup_one(args) -> Optional[Path]:
+    """Process pool worker: back up a single component"""
+    project_root, component, timestamp, compressor, verbose, compress_threads = args
+    backup = AgentArmyBackup(project_root, compressor, verbose, compress_threads)
+    backup.timestamp = timestamp
+    return backup.create_component_backup(component)
+
 def main():
     """Main backup execution"""
     parser = argparse.ArgumentParser(description="Agent Army Backup System")
@@ -370,10 +620,14 @@ def main():
                        help="List available backups")
     parser.add_argument("--cleanup", type=int, metavar="KEEP_COUNT", 
                        help="Clean up old backups, keeping specified number")
+    parser.add_argument("--compressor", choices=["gzip", "pigz", "zstd", "none"],
+                       help="Archive compressor (default: pigz if installed, else gzip)")
+    parser.add_argument("--quiet", action="store_true",
+                       help="Don't list each file as it is archived")
     
     args = parser.parse_args()
     
-    backup = AgentArmyBackup()
+    backup = AgentArmyBackup(compressor=args.compressor, verbose=not args.quiet)
     
     if args.list:
         backup.list_backups()
@@ -389,8 +643,18 @@ def main():
     if args.components:
         # Backup specific components
         components = [c.strip() for c in args.components.split(",")]
-        for component in components:
-            backup.create_component_backup(component)
+        if len(components) > 1:
+            # Each component is its own archive; compress them in parallel, giving
+            # each worker's pigz/zstd its share of the cores
+            workers = min(len(components), os.cpu_count() or 1)
+            compress_threads = max(1, (os.cpu_count() or 1) // workers)
+            jobs = [(backup.project_root, c, backup.timestamp, backup.compressor, backup.verbose,
+                     compress_threads)
+                    for c in components]
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                list(ex.map(_backup_one, jobs))
+        else:
+            backup.create_component_backup(components[0])
     elif args.type == "full":
         backup.create_full_backup()
     elif args.type == "incremental":
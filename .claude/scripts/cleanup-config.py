@@ -7,13 +7,48 @@ Safely removes redundant MCP server configurations while preserving functionalit
 import json
 import os
 import shutil
+from datetime import datetime
 from pathlib import Path
 
+# Prefer orjson for the ~/.claude.json round-trip when it is installed
+try:
+    import orjson
+    
+    def _loads(data: bytes):
+        return orjson.loads(data)
+    
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _loads(data: bytes):
+        return json.loads(data)
+    
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+def copy_file(src: Path, dst: Path):
+    """Copy file contents in-kernel where possible, then copy metadata"""
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        copied = False
+        if hasattr(os, 'copy_file_range'):
+            try:
+                while os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30):
+                    pass
+                copied = True
+            except OSError:
+                # Not supported for this filesystem pair; start over
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+        if not copied:
+            shutil.copyfileobj(fsrc, fdst, length=1 << 20)
+    shutil.copystat(src, dst)
+
 def backup_config(config_path: Path) -> Path:
     """Create timestamped backup of configuration"""
-    timestamp = os.popen('date +%Y%m%d_%H%M%S').read().strip()
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     backup_path = config_path.parent / f"{config_path.name}.backup.{timestamp}"
-    shutil.copy2(config_path, backup_path)
+    copy_file(config_path, backup_path)
     print(f"✅ Created backup: {backup_path}")
     return backup_path
 
@@ -29,8 +64,7 @@ def clean_claude_config():
     backup_path = backup_config(config_path)
     
     try:
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        config = _loads(config_path.read_bytes())
         
         # Remove global MCP server configurations that are project-specific
         agent_army_servers = ["workspace", "docs", "execution", "coord", "validation"]
@@ -51,32 +85,34 @@ def clean_claude_config():
             print(f"📊 Reduced global MCP servers from {original_count} to {new_count}")
         
         # Clean up project-specific configurations
-        if "projects" in config:
-            for project_path in config["projects"]:
-                project_config = config["projects"][project_path]
-                
-                if "mcpServers" in project_config:
-                    original_count = len(project_config["mcpServers"])
-                    
-                    # Remove agent army servers from non-agent-army projects
-                    if "agent-army-trial" not in project_path:
-                        for server_name in agent_army_servers:
-                            if server_name in project_config["mcpServers"]:
-                                server_config = project_config["mcpServers"][server_name]
-                                if "agent-army-trial" in str(server_config.get("command", "")):
-                                    del project_config["mcpServers"][server_name]
-                                    print(f"🗑️  Removed {server_name} from project: {project_path}")
-                    
-                    # For the agent-army-trial project, clear mcpServers (will use .claude/mcp.json)
-                    elif "agent-army-trial" in project_path:
-                        if project_config.get("mcpServers"):
-                            project_config["mcpServers"] = {}
-                            print(f"🧹 Cleared project-level MCP config for: {project_path}")
-                            print("   (Will now use .claude/mcp.json)")
+        targets = frozenset(agent_army_servers)
+        for project_path, project_config in config.get("projects", {}).items():
+            servers = project_config.get("mcpServers")
+            if not servers:
+                continue
+            
+            # Remove agent army servers from non-agent-army projects
+            if "agent-army-trial" not in project_path:
+                removed = [
+                    name for name, server_config in servers.items()
+                    if name in targets and "agent-army-trial" in str(server_config.get("command", ""))
+                ]
+                if removed:
+                    project_config["mcpServers"] = {
+                        name: server_config for name, server_config in servers.items()
+                        if name not in removed
+                    }
+                    for server_name in removed:
+                        print(f"🗑️  Removed {server_name} from project: {project_path}")
+            
+            # For the agent-army-trial project, clear mcpServers (will use .claude/mcp.json)
+            else:
+                project_config["mcpServers"] = {}
+                print(f"🧹 Cleared project-level MCP config for: {project_path}")
+                print("   (Will now use .claude/mcp.json)")
         
         # Write cleaned configuration
-        with open(config_path, 'w') as f:
-            json.dump(config, f, indent=2)
+        config_path.write_bytes(_dumps(config))
         
         print(f"✅ Configuration cleaned successfully!")
         print(f"📁 Backup available at: {backup_path}")
@@ -84,7 +120,7 @@ def clean_claude_config():
     except Exception as e:
         print(f"❌ Error cleaning configuration: {e}")
         print(f"🔄 Restoring from backup: {backup_path}")
-        shutil.copy2(backup_path, config_path)
+        copy_file(backup_path, config_path)
 
 def validate_project_config():
     """Validate that project-level MCP configuration is working"""
@@ -8,18 +8,51 @@ import os
 import sys
 import json
 import time
-import curses
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
-from collections import deque, defaultdict
-import subprocess
+from collections import Counter, deque, defaultdict
+from itertools import islice
+import shutil
+import threading
+
+# Prefer orjson for parsing events.jsonl and the agent registry when it is installed
+try:
+    import orjson
+    
+    def _loads(data: bytes):
+        return orjson.loads(data)
+except ImportError:
+    def _loads(data: bytes):
+        return json.loads(data)
+
+# Read size when tailing events.jsonl from the end
+TAIL_BLOCK_SIZE = 64 * 1024
+
+# Seconds to reuse the disk usage figure (free space rarely moves between refreshes)
+DISK_USAGE_TTL = 60.0
+
+# Project MCP servers shown on the dashboard
+MCP_SERVERS = ("workspace", "docs", "execution", "coord", "validation")
+
+# Seconds to reuse `claude mcp list` output ('r' forces a refresh)
+MCP_STATUS_TTL = 30.0
+
+# Screen row of the CPU/memory/disk figures
+SYSTEM_ROW = 4
 
 class MonitoringDashboard:
     """Interactive monitoring dashboard for Agent Army"""
     
-    def __init__(self, project_root: Optional[Path] = None):
+    def __init__(self, project_root: Optional[Path] = None, collect_process_count: bool = False,
+                 cpu_sample_interval: Optional[float] = None):
         self.project_root = project_root or Path.cwd()
+        
+        # Counting processes walks /proc; only the --simple report shows it
+        self.collect_process_count = collect_process_count
+        
+        # Seconds to block for a CPU sample; None reads the delta since the last refresh
+        self.cpu_sample_interval = cpu_sample_interval
         self.claude_dir = self.project_root / ".claude"
         self.logs_dir = self.claude_dir / "logs"
         
@@ -27,41 +60,113 @@ class MonitoringDashboard:
         self.mcp_status = {}
         self.agent_status = {}
         self.recent_events = deque(maxlen=50)
-        self.metrics = {
-            "total_events": 0,
-            "critical_count": 0,
-            "high_count": 0,
-            "medium_count": 0,
-            "low_count": 0
-        }
+        self._event_lines = deque(maxlen=50)  # _format_event of each entry in recent_events
+        self.format_events = True  # False when nothing will draw _event_lines
+        self.total_events = 0
+        self.severity_counts = Counter(critical=0, high=0, medium=0, low=0)
+        self.system_metrics = {}
         self.last_update = datetime.now()
         
+        # Guards the fields above while the background refresh publishes them
+        self._data_lock = threading.Lock()
+        self._data_version = 0
+        self._update_error = None
+        
+        # Data behind the last full repaint (see _render)
+        self._layout_key = None
+        
+        # (rounded figures, formatted strings) of the last system row drawn
+        self._system_row_cache = None
+        
+        # events.jsonl tail state: open handle, its inode and the next unread offset
+        self._events_fp = None
+        self._events_ino = None
+        self._events_off = 0
+        
+        # (monotonic time, status) of the last `claude mcp list` run, plus cache counters
+        self._mcp_cache = None
+        self._claude_bin = None
+        self.mcp_cache_hits = 0
+        self.mcp_cache_misses = 0
+        
+        # (mtime_ns, size, status) of the last parsed agent-registry.json
+        self._agent_cache = None
+        
+        # (monotonic time, percent) of the last disk usage reading
+        self._disk_usage = None
+        
+        # Prime psutil's CPU counter so later non-blocking reads return a delta
+        if cpu_sample_interval is None:
+            try:
+                import psutil
+                psutil.cpu_percent(interval=None)
+            except ImportError:
+                pass
+        
+    @property
+    def metrics(self) -> Dict[str, int]:
+        """Event totals under the names used for display"""
+        counts = self.severity_counts
+        return {
+            "total_events": self.total_events,
+            "critical_count": counts["critical"],
+            "high_count": counts["high"],
+            "medium_count": counts["medium"],
+            "low_count": counts["low"]
+        }
+        
     def fetch_mcp_status(self) -> Dict[str, Any]:
-        """Fetch current MCP server status"""
+        """Fetch current MCP server status, reusing it for MCP_STATUS_TTL seconds"""
+        now = time.monotonic()
+        if self._mcp_cache is not None and now - self._mcp_cache[0] < MCP_STATUS_TTL:
+            self.mcp_cache_hits += 1
+            return self._mcp_cache[1]
+            
+        self.mcp_cache_misses += 1
+        status = self._run_mcp_list()
+        self._mcp_cache = (time.monotonic(), status)
+        return status
+        
+    def _run_mcp_list(self) -> Dict[str, Any]:
+        """Query MCP server status from the claude CLI"""
+        import subprocess
+        
+        if self._claude_bin is None:
+            # Resolve the CLI once instead of searching PATH on every poll
+            self._claude_bin = shutil.which("claude") or ""
+        if not self._claude_bin:
+            return {"error": "claude CLI not found"}
+            
         try:
+            # An absolute path with close_fds=False lets subprocess use posix_spawn
             result = subprocess.run(
-                ["claude", "mcp", "list"],
+                [self._claude_bin, "mcp", "list"],
                 capture_output=True,
                 text=True,
-                timeout=10
+                timeout=3,
+                close_fds=False
             )
             
             if result.returncode == 0:
-                servers = ["workspace", "docs", "execution", "coord", "validation"]
+                # One pass over "name: command - status" lines
+                connected = {}
+                for line in result.stdout.splitlines():
+                    name, sep, rest = line.partition(":")
+                    if sep:
+                        connected[name.strip()] = "Connected" in rest
+                        
                 status = {}
-                
-                for server in servers:
-                    if server in result.stdout:
-                        if "Connected" in result.stdout:
-                            status[server] = "🟢 Connected"
-                        else:
-                            status[server] = "🟡 Available"
-                    else:
+                for server in MCP_SERVERS:
+                    if server not in connected:
                         status[server] = "🔴 Offline"
+                    elif connected[server]:
+                        status[server] = "🟢 Connected"
+                    else:
+                        status[server] = "🟡 Available"
                         
                 return status
             else:
-                return {server: "🔴 Error" for server in ["workspace", "docs", "execution", "coord", "validation"]}
+                return {server: "🔴 Error" for server in MCP_SERVERS}
                 
         except Exception as e:
             return {"error": str(e)}
@@ -71,51 +176,129 @@ class MonitoringDashboard:
         registry_path = self.claude_dir / "agents" / "agent-registry.json"
         
         try:
-            if registry_path.exists():
-                with open(registry_path, 'r') as f:
-                    registry = json.load(f)
-                    
-                return {
-                    "total_agents": registry.get("total_agents", 0),
-                    "hierarchy_levels": len(registry.get("hierarchy", {})),
-                    "coordination_rules": len(registry.get("coordination", {}))
-                }
+            st = os.stat(registry_path)
+        except FileNotFoundError:
+            return {"total_agents": 0}
         except Exception as e:
             return {"error": str(e)}
             
-        return {"total_agents": 0}
+        # The registry rarely changes; reuse the last summary while it is untouched
+        cache = self._agent_cache
+        if cache and cache[0] == st.st_mtime_ns and cache[1] == st.st_size:
+            return cache[2]
+            
+        try:
+            with open(registry_path, 'rb') as f:
+                registry = _loads(f.read())
+                
+            status = {
+                "total_agents": registry.get("total_agents", 0),
+                "hierarchy_levels": len(registry.get("hierarchy", {})),
+                "coordination_rules": len(registry.get("coordination", {}))
+            }
+        except Exception as e:
+            return {"error": str(e)}
+            
+        self._agent_cache = (st.st_mtime_ns, st.st_size, status)
+        return status
         
     def fetch_recent_events(self) -> List[Dict[str, Any]]:
-        """Fetch recent monitoring events"""
+        """Fetch monitoring events appended since the previous call"""
         events = []
         events_file = self.logs_dir / "events.jsonl"
         
-        if events_file.exists():
-            try:
-                with open(events_file, 'r') as f:
-                    lines = f.readlines()[-20:]  # Last 20 events
-                    
-                for line in lines:
-                    try:
-                        event = json.loads(line)
-                        events.append(event)
-                    except json.JSONDecodeError:
-                        pass
-            except Exception:
-                pass
+        try:
+            st = os.stat(events_file)
+        except OSError:
+            return events
+            
+        try:
+            if self._events_fp is None or st.st_ino != self._events_ino or st.st_size < self._events_off:
+                # First read, or the log was rotated/truncated: start from the tail
+                if self._events_fp:
+                    self._events_fp.close()
+                self._events_fp = open(events_file, 'rb')
+                self._events_ino = st.st_ino
+                lines = self._tail_lines(self._events_fp, 20)  # Last 20 events
+                self._events_off = self._events_fp.tell()
+            elif st.st_size > self._events_off:
+                self._events_fp.seek(self._events_off)
+                data = self._events_fp.read()
                 
+                # Leave a partially written last line for the next call
+                lines, end = self._complete_lines(data)
+                self._events_off += end
+            else:
+                lines = []
+                
+            for line in lines:
+                if not line:
+                    continue
+                try:
+                    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+                    event = _loads(line)
+                    if isinstance(event, dict):
+                        events.append(event)
+                except json.JSONDecodeError:
+                    pass
+        except Exception:
+            pass
+            
         return events
         
+    @staticmethod
+    def _tail_lines(f, count: int) -> List[bytes]:
+        """Return the last count complete lines of a binary file, reading backwards from EOF"""
+        end = f.seek(0, os.SEEK_END)
+        block = TAIL_BLOCK_SIZE
+        
+        # Widen the window until it holds count full lines (or the whole file)
+        while True:
+            start = max(0, end - block)
+            f.seek(start)
+            data = f.read(end - start)
+            if start == 0 or data.count(b'\n', 0, len(data) - 1) >= count:
+                break
+            block *= 2
+            
+        # Stop at the last newline so a line still being written is read next time
+        lines, complete = MonitoringDashboard._complete_lines(data)
+        f.seek(start + complete)
+        if start > 0 and lines:
+            # The first line in the window is probably partial
+            del lines[0]
+        return lines[-count:]
+        
+    @staticmethod
+    def _complete_lines(data: bytes) -> tuple:
+        """Split raw JSONL bytes into newline-terminated lines and the bytes they span"""
+        # Splitting in place avoids copying data[:end] first; the last piece is
+        # empty or an unterminated line
+        lines = data.split(b'\n')
+        lines.pop()
+        return lines, data.rfind(b'\n') + 1
+        
+    @staticmethod
+    def _format_event(event: Dict[str, Any]) -> tuple:
+        """Pre-format an event's fixed-width columns as (prefix, message, severity)"""
+        # Fields may be missing or null in hand-written log lines
+        timestamp = str(event.get("timestamp") or "")[:19]  # Just date and time
+        severity = str(event.get("severity") or "info")
+        component = str(event.get("component") or "Unknown")[:15]
+        return f"{timestamp} [{severity:8}] {component:15} ", str(event.get("message") or ""), severity
+        
     def fetch_system_metrics(self) -> Dict[str, Any]:
         """Fetch system resource metrics"""
         try:
             import psutil
             
             return {
-                "cpu_percent": psutil.cpu_percent(interval=1),
+                # The refresh loop reads usage since its previous call instead of sleeping;
+                # a one-shot report has no previous call, so it takes a blocking sample
+                "cpu_percent": psutil.cpu_percent(interval=self.cpu_sample_interval),
                 "memory_percent": psutil.virtual_memory().percent,
-                "disk_percent": psutil.disk_usage(self.project_root).percent,
-                "processes": len(psutil.pids())
+                "disk_percent": self._disk_percent(psutil),
+                "processes": len(psutil.pids()) if self.collect_process_count else None
             }
         except ImportError:
             return {
@@ -125,34 +308,61 @@ class MonitoringDashboard:
                 "processes": 0
             }
             
+    def _disk_percent(self, psutil) -> float:
+        """Disk usage of the project volume, cached for DISK_USAGE_TTL seconds"""
+        now = time.monotonic()
+        if self._disk_usage is None or now - self._disk_usage[0] >= DISK_USAGE_TTL:
+            self._disk_usage = (now, psutil.disk_usage(self.project_root).percent)
+        return self._disk_usage[1]
+        
     def update_data(self):
         """Update all dashboard data"""
-        self.mcp_status = self.fetch_mcp_status()
-        self.agent_status = self.fetch_agent_status()
-        
-        # Update events
+        # Do the slow I/O first, then publish the results under the lock
+        mcp_status = self.fetch_mcp_status()
+        agent_status = self.fetch_agent_status()
+        system_metrics = self.fetch_system_metrics()
         events = self.fetch_recent_events()
-        for event in events:
-            if event not in self.recent_events:
-                self.recent_events.append(event)
-                self.metrics["total_events"] += 1
-                
-                severity = event.get("severity", "").lower()
-                if severity == "critical":
-                    self.metrics["critical_count"] += 1
-                elif severity == "high":
-                    self.metrics["high_count"] += 1
-                elif severity == "medium":
-                    self.metrics["medium_count"] += 1
-                elif severity == "low":
-                    self.metrics["low_count"] += 1
-                    
-        self.last_update = datetime.now()
         
+        # Format before publishing so a bad event cannot leave the deques out of step
+        event_lines = list(map(self._format_event, events)) if self.format_events else None
+        
+        with self._data_lock:
+            self.mcp_status = mcp_status
+            self.agent_status = agent_status
+            self.system_metrics = system_metrics
+            
+            # The offset-based tail only returns events not seen before
+            self.recent_events.extend(events)
+            if event_lines is not None:
+                self._event_lines.extend(event_lines)
+            self.total_events += len(events)
+            self.severity_counts.update(str(event.get("severity") or "").lower() for event in events)
+                
+            self.last_update = datetime.now()
+            self._update_error = None
+            self._data_version += 1
+            
+    def _refresh_loop(self, stop: threading.Event, wake: threading.Event):
+        """Background producer: refresh data every 5 seconds or when woken"""
+        while not stop.is_set():
+            try:
+                self.update_data()
+            except Exception as e:
+                # Shown on the dashboard until the next successful refresh
+                with self._data_lock:
+                    self._update_error = str(e)
+                    self._data_version += 1
+                
+            # Auto-refresh every 5 seconds
+            wake.wait(5)
+            wake.clear()
+            
     def draw_dashboard(self, stdscr):
         """Draw the dashboard interface"""
+        import curses
+        
         curses.curs_set(0)  # Hide cursor
-        stdscr.nodelay(1)   # Non-blocking input
+        stdscr.timeout(100)  # Poll input at 10 Hz
         
         # Define colors
         curses.init_pair(1, curses.COLOR_GREEN, curses.COLOR_BLACK)
@@ -161,135 +371,213 @@ class MonitoringDashboard:
         curses.init_pair(4, curses.COLOR_CYAN, curses.COLOR_BLACK)
         curses.init_pair(5, curses.COLOR_WHITE, curses.COLOR_BLACK)
         
-        while True:
-            try:
-                # Update data
-                self.update_data()
-                
-                # Clear screen
-                stdscr.clear()
-                height, width = stdscr.getmaxyx()
-                
-                # Header
-                header = "🚀 Agent Army Monitoring Dashboard"
-                stdscr.addstr(0, (width - len(header)) // 2, header, curses.A_BOLD)
-                stdscr.addstr(1, 0, "=" * width)
-                
-                row = 3
-                
-                # System Overview
-                stdscr.addstr(row, 0, "📊 System Overview", curses.A_BOLD)
-                row += 1
-                
-                system_metrics = self.fetch_system_metrics()
-                stdscr.addstr(row, 2, f"CPU: {system_metrics['cpu_percent']:.1f}%")
-                stdscr.addstr(row, 20, f"Memory: {system_metrics['memory_percent']:.1f}%")
-                stdscr.addstr(row, 40, f"Disk: {system_metrics['disk_percent']:.1f}%")
-                row += 2
-                
-                # MCP Server Status
-                stdscr.addstr(row, 0, "🔧 MCP Servers", curses.A_BOLD)
-                row += 1
-                
-                col = 2
-                for server, status in self.mcp_status.items():
-                    if "🟢" in str(status):
-                        color = curses.color_pair(1)
-                    elif "🟡" in str(status):
-                        color = curses.color_pair(2)
-                    else:
-                        color = curses.color_pair(3)
-                        
-                    stdscr.addstr(row, col, f"{server}: {status}", color)
-                    col += 25
-                    if col > width - 20:
-                        row += 1
-                        col = 2
-                row += 2
-                
-                # Agent Status
-                stdscr.addstr(row, 0, "🤖 Agent System", curses.A_BOLD)
-                row += 1
-                
-                if "error" not in self.agent_status:
-                    stdscr.addstr(row, 2, f"Total Agents: {self.agent_status.get('total_agents', 0)}")
-                    stdscr.addstr(row, 25, f"Hierarchy Levels: {self.agent_status.get('hierarchy_levels', 0)}")
-                    stdscr.addstr(row, 50, f"Coordination Rules: {self.agent_status.get('coordination_rules', 0)}")
-                else:
-                    stdscr.addstr(row, 2, f"Error: {self.agent_status['error']}", curses.color_pair(3))
-                row += 2
-                
-                # Event Statistics
-                stdscr.addstr(row, 0, "📈 Event Statistics", curses.A_BOLD)
-                row += 1
-                
-                stdscr.addstr(row, 2, f"Total Events: {self.metrics['total_events']}")
-                stdscr.addstr(row, 20, f"🔴 Critical: {self.metrics['critical_count']}", curses.color_pair(3))
-                stdscr.addstr(row, 35, f"🟠 High: {self.metrics['high_count']}", curses.color_pair(2))
-                stdscr.addstr(row, 48, f"🟡 Medium: {self.metrics['medium_count']}", curses.color_pair(2))
-                stdscr.addstr(row, 63, f"🟢 Low: {self.metrics['low_count']}", curses.color_pair(1))
-                row += 2
-                
-                # Recent Events
-                stdscr.addstr(row, 0, "📜 Recent Events", curses.A_BOLD)
-                row += 1
-                
-                # Display last few events
-                event_display_count = min(len(self.recent_events), height - row - 3)
-                if event_display_count > 0:
-                    for i in range(event_display_count):
-                        event = list(self.recent_events)[-1 - i]
+        # Color lookups used per row while rendering
+        self._severity_color = {
+            "critical": curses.color_pair(3),
+            "high": curses.color_pair(2)
+        }
+        self._status_color = {
+            "🟢": curses.color_pair(1),
+            "🟡": curses.color_pair(2)
+        }
+        
+        # Data is fetched on a background thread so input stays responsive
+        stop = threading.Event()
+        wake = threading.Event()
+        producer = threading.Thread(target=self._refresh_loop, args=(stop, wake), daemon=True)
+        producer.start()
+        
+        stdscr.addstr(0, 0, "Loading...")
+        stdscr.refresh()
+        
+        rendered_version = 0
+        hold_until = 0.0  # Keep an error message up until then without blocking input
+        self._layout_key = None
+        try:
+            while True:
+                try:
+                    # Redraw only when new data has been published
+                    if rendered_version != self._data_version and time.monotonic() >= hold_until:
+                        with self._data_lock:
+                            rendered_version = self._data_version
+                            self._render(stdscr)
+                        stdscr.noutrefresh()
+                        curses.doupdate()
                         
-                        # Format event display
-                        timestamp = event.get("timestamp", "")[:19]  # Just date and time
-                        severity = event.get("severity", "info")
-                        component = event.get("component", "Unknown")[:15]
-                        message = event.get("message", "")[:width - 50]
+                    # Check for user input (waits up to 100 ms)
+                    key = stdscr.getch()
+                    if key == ord('q'):
+                        break
+                    elif key == ord('r'):
+                        self._mcp_cache = None
+                        wake.set()  # Force refresh
+                    elif key == curses.KEY_RESIZE:
+                        rendered_version = None
+                        self._layout_key = None
                         
-                        # Color based on severity
-                        if severity == "critical":
-                            color = curses.color_pair(3)
-                        elif severity == "high":
-                            color = curses.color_pair(2)
-                        else:
-                            color = curses.color_pair(5)
-                            
-                        event_line = f"{timestamp} [{severity:8}] {component:15} {message}"
-                        if row < height - 2:
-                            stdscr.addstr(row, 2, event_line[:width-3], color)
-                            row += 1
-                else:
-                    stdscr.addstr(row, 2, "No recent events", curses.color_pair(5))
-                    
-                # Footer
-                footer_row = height - 1
-                update_time = self.last_update.strftime("%H:%M:%S")
-                footer = f"Last Update: {update_time} | Press 'q' to quit | Press 'r' to refresh"
-                stdscr.addstr(footer_row, 0, footer[:width-1], curses.A_DIM)
-                
-                # Refresh display
-                stdscr.refresh()
-                
-                # Check for user input
-                key = stdscr.getch()
-                if key == ord('q'):
+                except KeyboardInterrupt:
                     break
-                elif key == ord('r'):
-                    continue  # Force refresh
+                except Exception as e:
+                    # Display error and continue
+                    height, _ = stdscr.getmaxyx()
+                    stdscr.addstr(height // 2, 2, f"Error: {str(e)}", curses.color_pair(3))
+                    stdscr.refresh()
                     
-                # Auto-refresh every 5 seconds
-                time.sleep(5)
-                
-            except KeyboardInterrupt:
-                break
-            except Exception as e:
-                # Display error and continue
-                stdscr.addstr(height // 2, 2, f"Error: {str(e)}", curses.color_pair(3))
-                stdscr.refresh()
-                time.sleep(2)
+                    # Repaint everything once the message has been shown for 2 seconds
+                    rendered_version = None
+                    self._layout_key = None
+                    hold_until = time.monotonic() + 2
+        finally:
+            stop.set()
+            wake.set()
+            
+    def _render(self, stdscr):
+        """Draw the dashboard, repainting only the sections whose data changed"""
+        import curses
+        
+        height, width = stdscr.getmaxyx()
+        
+        # Everything below the system row is positioned by the data it shows
+        layout_key = (
+            height, width,
+            tuple(self.mcp_status.items()),
+            tuple(self.agent_status.items()),
+            self.total_events,
+            self._update_error
+        )
+        if layout_key == self._layout_key:
+            # Only the resource figures and the update time moved
+            stdscr.move(SYSTEM_ROW, 0)
+            stdscr.clrtoeol()
+            self._draw_system_row(stdscr)
+            self._draw_footer(stdscr, height, width)
+            return
+        self._layout_key = layout_key
+        
+        # erase() lets curses send only the changed cells, unlike clear()
+        stdscr.erase()
+        
+        # Header
+        header = "🚀 Agent Army Monitoring Dashboard"
+        stdscr.addstr(0, (width - len(header)) // 2, header, curses.A_BOLD)
+        stdscr.addstr(1, 0, "=" * width)
+        
+        row = 3
+        
+        # System Overview
+        stdscr.addstr(row, 0, "📊 System Overview", curses.A_BOLD)
+        row += 1
+        
+        self._draw_system_row(stdscr)
+        row += 2
+        
+        # MCP Server Status
+        stdscr.addstr(row, 0, "🔧 MCP Servers", curses.A_BOLD)
+        row += 1
+        
+        col = 2
+        status_color = self._status_color
+        offline_color = curses.color_pair(3)
+        for server, status in self.mcp_status.items():
+            # Status strings start with their indicator emoji
+            color = status_color.get(str(status)[:1], offline_color)
+            stdscr.addstr(row, col, f"{server}: {status}", color)
+            col += 25
+            if col > width - 20:
+                row += 1
+                col = 2
+        row += 2
+        
+        # Agent Status
+        stdscr.addstr(row, 0, "🤖 Agent System", curses.A_BOLD)
+        row += 1
+        
+        if "error" not in self.agent_status:
+            # One padded line for columns 2, 25 and 50
+            total = f"Total Agents: {self.agent_status.get('total_agents', 0)}"
+            levels = f"Hierarchy Levels: {self.agent_status.get('hierarchy_levels', 0)}"
+            rules = f"Coordination Rules: {self.agent_status.get('coordination_rules', 0)}"
+            stdscr.addstr(row, 2, f"{total:<23}{levels:<25}{rules}")
+        else:
+            stdscr.addstr(row, 2, f"Error: {self.agent_status['error']}", curses.color_pair(3))
+        row += 2
+        
+        # Event Statistics
+        stdscr.addstr(row, 0, "📈 Event Statistics", curses.A_BOLD)
+        row += 1
+        
+        # Mixed colors, so one addstr per (column, text, color) field
+        metrics = self.metrics
+        stat_fields = (
+            (2, f"Total Events: {metrics['total_events']}", curses.A_NORMAL),
+            (20, f"🔴 Critical: {metrics['critical_count']}", curses.color_pair(3)),
+            (35, f"🟠 High: {metrics['high_count']}", curses.color_pair(2)),
+            (48, f"🟡 Medium: {metrics['medium_count']}", curses.color_pair(2)),
+            (63, f"🟢 Low: {metrics['low_count']}", curses.color_pair(1))
+        )
+        for col, text, attr in stat_fields:
+            stdscr.addstr(row, col, text, attr)
+        row += 2
+        
+        # Recent Events
+        stdscr.addstr(row, 0, "📜 Recent Events", curses.A_BOLD)
+        row += 1
+        
+        # Display last few events
+        event_display_count = min(len(self.recent_events), height - row - 3)
+        if event_display_count > 0:
+            severity_color = self._severity_color
+            default_color = curses.color_pair(5)
+            # Newest first
+            for prefix, message, severity in islice(reversed(self._event_lines), event_display_count):
+                # Color based on severity
+                color = severity_color.get(severity, default_color)
                 
+                event_line = prefix + message[:width - 50]
+                if row < height - 2:
+                    stdscr.addstr(row, 2, event_line[:width-3], color)
+                    row += 1
+        else:
+            stdscr.addstr(row, 2, "No recent events", curses.color_pair(5))
+            
+        if self._update_error:
+            stdscr.addstr(height - 2, 0, f"Error: {self._update_error}"[:width-1], curses.color_pair(3))
+            
+        self._draw_footer(stdscr, height, width)
+        
+    def _draw_system_row(self, stdscr):
+        """Draw the CPU/memory/disk figures"""
+        system_metrics = self.system_metrics
+        
+        # Whole percents are plenty on screen and let unchanged figures reuse their strings
+        key = (
+            round(system_metrics['cpu_percent']),
+            round(system_metrics['memory_percent']),
+            round(system_metrics['disk_percent'])
+        )
+        if self._system_row_cache is None or self._system_row_cache[0] != key:
+            cpu, memory, disk = key
+            # Fields padded to columns 2, 20 and 40 so the row is a single addstr
+            cpu_text = f"CPU: {cpu}%"
+            memory_text = f"Memory: {memory}%"
+            self._system_row_cache = (key, f"{cpu_text:<18}{memory_text:<20}Disk: {disk}%")
+            
+        stdscr.addstr(SYSTEM_ROW, 2, self._system_row_cache[1])
+        
+    def _draw_footer(self, stdscr, height: int, width: int):
+        """Draw the status line"""
+        import curses
+        
+        footer_row = height - 1
+        update_time = self.last_update.strftime("%H:%M:%S")
+        footer = f"Last Update: {update_time} | Press 'q' to quit | Press 'r' to refresh"
+        stdscr.addstr(footer_row, 0, footer[:width-1], curses.A_DIM)
+            
     def run(self):
         """Run the dashboard"""
+        # curses is only needed (and only available everywhere) for the interactive view
+        import curses
+        
         try:
             curses.wrapper(self.draw_dashboard)
         except Exception as e:
@@ -297,53 +585,63 @@ class MonitoringDashboard:
             
     def print_simple_status(self):
         """Print simple status (non-interactive)"""
+        # The report below reads recent_events directly
+        self.format_events = False
         self.update_data()
         
-        print("\n🚀 Agent Army Status Report")
-        print("=" * 60)
-        print(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print()
+        # Collect the report and write it in one go
+        out = []
+        line = out.append
+        
+        line("\n🚀 Agent Army Status Report")
+        line("=" * 60)
+        line(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        line("")
         
         # MCP Servers
-        print("🔧 MCP Server Status:")
+        line("🔧 MCP Server Status:")
         for server, status in self.mcp_status.items():
-            print(f"  {server:15} {status}")
-        print()
+            line(f"  {server:15} {status}")
+        line("")
         
         # Agent System
-        print("🤖 Agent System:")
+        line("🤖 Agent System:")
         if "error" not in self.agent_status:
-            print(f"  Total Agents:       {self.agent_status.get('total_agents', 0)}")
-            print(f"  Hierarchy Levels:   {self.agent_status.get('hierarchy_levels', 0)}")
-            print(f"  Coordination Rules: {self.agent_status.get('coordination_rules', 0)}")
+            line(f"  Total Agents:       {self.agent_status.get('total_agents', 0)}")
+            line(f"  Hierarchy Levels:   {self.agent_status.get('hierarchy_levels', 0)}")
+            line(f"  Coordination Rules: {self.agent_status.get('coordination_rules', 0)}")
         else:
-            print(f"  Error: {self.agent_status['error']}")
-        print()
+            line(f"  Error: {self.agent_status['error']}")
+        line("")
         
         # System Resources
-        system_metrics = self.fetch_system_metrics()
-        print("💻 System Resources:")
-        print(f"  CPU Usage:    {system_metrics['cpu_percent']:.1f}%")
-        print(f"  Memory Usage: {system_metrics['memory_percent']:.1f}%")
-        print(f"  Disk Usage:   {system_metrics['disk_percent']:.1f}%")
-        print(f"  Processes:    {system_metrics['processes']}")
-        print()
+        system_metrics = self.system_metrics
+        line("💻 System Resources:")
+        line(f"  CPU Usage:    {system_metrics['cpu_percent']:.1f}%")
+        line(f"  Memory Usage: {system_metrics['memory_percent']:.1f}%")
+        line(f"  Disk Usage:   {system_metrics['disk_percent']:.1f}%")
+        if system_metrics['processes'] is not None:
+            line(f"  Processes:    {system_metrics['processes']}")
+        line("")
         
         # Event Summary
-        print("📈 Event Summary:")
-        print(f"  Total Events:    {self.metrics['total_events']}")
-        print(f"  Critical Events: {self.metrics['critical_count']}")
-        print(f"  High Priority:   {self.metrics['high_count']}")
-        print(f"  Medium Priority: {self.metrics['medium_count']}")
-        print(f"  Low Priority:    {self.metrics['low_count']}")
-        print()
+        line("📈 Event Summary:")
+        metrics = self.metrics
+        line(f"  Total Events:    {metrics['total_events']}")
+        line(f"  Critical Events: {metrics['critical_count']}")
+        line(f"  High Priority:   {metrics['high_count']}")
+        line(f"  Medium Priority: {metrics['medium_count']}")
+        line(f"  Low Priority:    {metrics['low_count']}")
+        line("")
         
         # Recent Critical Events
         critical_events = [e for e in self.recent_events if e.get("severity") == "critical"]
         if critical_events:
-            print("🚨 Recent Critical Events:")
+            line("🚨 Recent Critical Events:")
             for event in critical_events[-5:]:
-                print(f"  [{event.get('timestamp', '')[:19]}] {event.get('component', 'Unknown')}: {event.get('message', '')}")
+                line(f"  [{str(event.get('timestamp') or '')[:19]}] {event.get('component') or 'Unknown'}: {event.get('message') or ''}")
+                
+        sys.stdout.write("\n".join(out) + "\n")
 
 def main():
     """Main dashboard execution"""
@@ -357,7 +655,10 @@ def main():
     
     args = parser.parse_args()
     
-    dashboard = MonitoringDashboard()
+    dashboard = MonitoringDashboard(
+        collect_process_count=args.simple,
+        cpu_sample_interval=1 if args.simple else None
+    )
     
     if args.simple:
         dashboard.print_simple_status()
@@ -4,6 +4,7 @@ Agent Army Error Monitoring and Alerting System
 Real-time monitoring, error tracking, and notification system for Agent Army
 """
 
+import atexit
 import os
 import sys
 import json
@@ -12,13 +13,13 @@ import logging
 import smtplib
 import threading
 import subprocess
+import zlib
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from collections import deque, defaultdict
-import hashlib
 
 # Configure logging
 logging.basicConfig(
@@ -35,6 +36,15 @@ class AlertSeverity(Enum):
     LOW = "low"            # Minor issue, informational
     INFO = "info"          # Informational only
 
+# Severity levels from least to most severe, for threshold checks
+_SEV_RANK = {
+    AlertSeverity.INFO: 0,
+    AlertSeverity.LOW: 1,
+    AlertSeverity.MEDIUM: 2,
+    AlertSeverity.HIGH: 3,
+    AlertSeverity.CRITICAL: 4
+}
+
 class EventType(Enum):
     """Types of events to monitor"""
     AGENT_ERROR = "agent_error"
@@ -63,7 +73,8 @@ class MonitoringEvent:
         """Generate unique error ID if not provided"""
         if not self.error_id:
             content = f"{self.timestamp}{self.event_type}{self.component}{self.message}"
-            self.error_id = hashlib.md5(content.encode()).hexdigest()[:8]
+            # CRC32 is enough for a short log ID and, unlike hash(), is stable across processes
+            self.error_id = f"{zlib.crc32(content.encode()):08x}"
 
 @dataclass
 class AlertRule:
@@ -77,6 +88,79 @@ class AlertRule:
     action: str  # "notify", "log", "escalate"
     enabled: bool = True
 
+class BufferedLogWriter:
+    """Append-only log file written in batches by a background thread"""
+    
+    def __init__(self, file_path: Path, flush_interval: float = 0.5):
+        self.file_path = file_path
+        self.flush_interval = flush_interval
+        
+        # Lines queued by any thread; only flush() touches the file handle
+        self._buffer: deque = deque()
+        self._file = None
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        atexit.register(self.close)
+        
+    def write(self, line: str):
+        """Queue a line (including its newline) for the next flush"""
+        self._buffer.append(line)
+        if self._closed.is_set():
+            # No flush thread will run again; write through and let errors raise
+            try:
+                self.flush()
+            finally:
+                self._close_file()
+            return
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None and not self._closed.is_set():
+                    self._thread = threading.Thread(
+                        target=self._run, name=f"LogWriter({self.file_path.name})", daemon=True
+                    )
+                    self._thread.start()
+                    
+    def flush(self):
+        """Write all queued lines with a single writelines call"""
+        with self._lock:
+            lines = []
+            while self._buffer:
+                lines.append(self._buffer.popleft())
+            if not lines:
+                return
+                
+            if self._file is None:
+                self._file = open(self.file_path, 'a', buffering=1 << 16)
+            self._file.writelines(lines)
+            self._file.flush()
+            
+    def close(self):
+        """Stop the flush thread, write what is left and close the file"""
+        self._closed.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5)
+        try:
+            self.flush()
+        except OSError as e:
+            logger.error(f"Failed to write {self.file_path}: {e}")
+        self._close_file()
+        
+    def _close_file(self):
+        """Close the file handle; the next flush reopens it"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                
+    def _run(self):
+        """Flush every flush_interval seconds until closed"""
+        while not self._closed.wait(self.flush_interval):
+            try:
+                self.flush()
+            except OSError as e:
+                logger.error(f"Failed to write {self.file_path}: {e}")
+
 class NotificationChannel:
     """Base class for notification channels"""
     
@@ -90,21 +174,21 @@ class FileNotificationChannel(NotificationChannel):
     def __init__(self, file_path: Path):
         self.file_path = file_path
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        self.writer = BufferedLogWriter(file_path)
         
     def send(self, event: MonitoringEvent, message: str) -> bool:
-        """Write notification to file"""
+        """Queue notification for the file writer (True means queued, not yet written)"""
         try:
-            with open(self.file_path, 'a') as f:
-                notification = {
-                    "timestamp": event.timestamp.isoformat(),
-                    "error_id": event.error_id,
-                    "severity": event.severity.value,
-                    "type": event.event_type.value,
-                    "component": event.component,
-                    "message": message,
-                    "details": event.details
-                }
-                f.write(json.dumps(notification) + '\n')
+            notification = {
+                "timestamp": event.timestamp.isoformat(),
+                "error_id": event.error_id,
+                "severity": event.severity.value,
+                "type": event.event_type.value,
+                "component": event.component,
+                "message": message,
+                "details": event.details
+            }
+            self.writer.write(json.dumps(notification) + '\n')
             return True
         except Exception as e:
             logger.error(f"Failed to write notification: {e}")
@@ -184,9 +268,19 @@ class AgentArmyMonitor:
         self.logs_dir = self.claude_dir / "logs"
         self.logs_dir.mkdir(parents=True, exist_ok=True)
         
+        # Event and alert logs, written in batches off the add_event path
+        self.event_log = BufferedLogWriter(self.logs_dir / "events.jsonl")
+        self.alert_log = BufferedLogWriter(self.logs_dir / "alerts.log")
+        
         # Event storage
         self.events: deque = deque(maxlen=10000)  # Keep last 10k events
-        self.event_counts: Dict[EventType, Dict[AlertSeverity, int]] = defaultdict(lambda: defaultdict(int))
+        self.event_counts: Dict[Tuple[EventType, AlertSeverity], int] = {
+            (event_type, severity): 0 for event_type in EventType for severity in AlertSeverity
+        }
+        
+        # Per-type events still inside the longest alert rule window for that type
+        self.events_by_type: Dict[EventType, deque] = defaultdict(deque)
+        self.max_window_by_type: Dict[EventType, timedelta] = {}
         
         # Alert rules
         self.alert_rules: List[AlertRule] = []
@@ -283,6 +377,13 @@ class AgentArmyMonitor:
             ),
         ]
         
+        # How long each rule-checked event type has to be kept for _get_recent_events
+        self.max_window_by_type = {}
+        for rule in self.alert_rules:
+            window = timedelta(seconds=rule.time_window)
+            if window > self.max_window_by_type.get(rule.event_type, timedelta(0)):
+                self.max_window_by_type[rule.event_type] = window
+        
     def setup_notification_channels(self):
         """Setup notification channels"""
         # Always add file and console channels
@@ -302,21 +403,34 @@ class AgentArmyMonitor:
             
     def add_event(self, event: MonitoringEvent):
         """Add monitoring event and check alert rules"""
+        now = datetime.now()
         self.events.append(event)
-        self.event_counts[event.event_type][event.severity] += 1
+        
+        max_window = self.max_window_by_type.get(event.event_type)
+        if max_window is not None:
+            typed = self.events_by_type[event.event_type]
+            typed.append(event)
+            
+            # Drop events no rule for this type can look back to
+            oldest = now - max_window
+            while typed and typed[0].timestamp < oldest:
+                typed.popleft()
+                
+        self.event_counts[(event.event_type, event.severity)] += 1
         self.metrics["events_processed"] += 1
         
         if event.severity in [AlertSeverity.CRITICAL, AlertSeverity.HIGH]:
             self.metrics["errors_detected"] += 1
             
         # Check alert rules
-        self.check_alert_rules(event)
+        self.check_alert_rules(event, now)
         
         # Log event
         self._log_event(event)
         
-    def check_alert_rules(self, event: MonitoringEvent):
+    def check_alert_rules(self, event: MonitoringEvent, now: Optional[datetime] = None):
         """Check if event triggers any alert rules"""
+        now = now or datetime.now()
         for rule in self.alert_rules:
             if not rule.enabled:
                 continue
@@ -325,13 +439,14 @@ class AgentArmyMonitor:
                 continue
                 
             # Check severity threshold
-            if self._compare_severity(event.severity, rule.severity_threshold) < 0:
+            if _SEV_RANK[event.severity] < _SEV_RANK[rule.severity_threshold]:
                 continue
                 
             # Check frequency threshold
             recent_events = self._get_recent_events(
                 rule.event_type,
-                rule.time_window
+                rule.time_window,
+                now
             )
             
             if len(recent_events) >= rule.frequency_threshold:
@@ -384,6 +499,7 @@ class AgentArmyMonitor:
         """Send notifications through all channels"""
         for channel in self.notification_channels:
             try:
+                # File channels report a queued line; write failures are logged on flush
                 if channel.send(event, message):
                     self.metrics["notifications_sent"] += 1
             except Exception as e:
@@ -391,52 +507,34 @@ class AgentArmyMonitor:
                 
     def _log_alert(self, event: MonitoringEvent, message: str):
         """Log alert to file"""
-        alert_log = self.logs_dir / "alerts.log"
-        with open(alert_log, 'a') as f:
-            f.write(f"[{event.timestamp}] {message}\n")
+        self.alert_log.write(f"[{event.timestamp}] {message}\n")
             
     def _log_event(self, event: MonitoringEvent):
         """Log event to file"""
-        event_log = self.logs_dir / "events.jsonl"
-        with open(event_log, 'a') as f:
-            f.write(json.dumps({
-                "timestamp": event.timestamp.isoformat(),
-                "error_id": event.error_id,
-                "type": event.event_type.value,
-                "severity": event.severity.value,
-                "component": event.component,
-                "message": event.message,
-                "details": event.details
-            }) + '\n')
+        self.event_log.write(json.dumps({
+            "timestamp": event.timestamp.isoformat(),
+            "error_id": event.error_id,
+            "type": event.event_type.value,
+            "severity": event.severity.value,
+            "component": event.component,
+            "message": event.message,
+            "details": event.details
+        }) + '\n')
             
-    def _get_recent_events(self, event_type: EventType, time_window: int) -> List[MonitoringEvent]:
+    def _get_recent_events(self, event_type: EventType, time_window: int,
+                           now: Optional[datetime] = None) -> List[MonitoringEvent]:
         """Get events of specified type within time window"""
-        cutoff_time = datetime.now() - timedelta(seconds=time_window)
-        return [
-            e for e in self.events
-            if e.event_type == event_type and e.timestamp >= cutoff_time
-        ]
+        cutoff_time = (now or datetime.now()) - timedelta(seconds=time_window)
         
-    def _compare_severity(self, sev1: AlertSeverity, sev2: AlertSeverity) -> int:
-        """Compare severity levels (-1: less, 0: equal, 1: greater)"""
-        severity_order = {
-            AlertSeverity.INFO: 0,
-            AlertSeverity.LOW: 1,
-            AlertSeverity.MEDIUM: 2,
-            AlertSeverity.HIGH: 3,
-            AlertSeverity.CRITICAL: 4
-        }
-        
-        val1 = severity_order.get(sev1, 0)
-        val2 = severity_order.get(sev2, 0)
+        # Walk back from the newest event and stop at the first one outside the window
+        recent = []
+        for e in reversed(self.events_by_type.get(event_type, ())):
+            if e.timestamp < cutoff_time:
+                break
+            recent.append(e)
+        recent.reverse()
+        return recent
         
-        if val1 < val2:
-            return -1
-        elif val1 > val2:
-            return 1
-        else:
-            return 0
-            
     def monitor_mcp_servers(self):
         """Monitor MCP server health"""
         while self.monitoring_active:
@@ -620,13 +718,10 @@ class AgentArmyMonitor:
     def generate_status_report(self) -> Dict[str, Any]:
         """Generate current status report"""
         # Count events by type and severity
-        event_summary = {}
-        for event_type in EventType:
-            event_summary[event_type.value] = {}
-            for severity in AlertSeverity:
-                count = self.event_counts[event_type][severity]
-                if count > 0:
-                    event_summary[event_type.value][severity.value] = count
+        event_summary = {event_type.value: {} for event_type in EventType}
+        for (event_type, severity), count in self.event_counts.items():
+            if count > 0:
+                event_summary[event_type.value][severity.value] = count
                     
         # Get recent critical events
         recent_critical = [
@@ -12,6 +12,11 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
+# Add scripts directory to path for imports
+sys.path.append(str(Path(__file__).parent))
+
+from task_store import get_store
+
 class CoordinationStarter:
     """Starts coordination workflows for assigned tasks"""
     
@@ -21,6 +26,9 @@ class CoordinationStarter:
         self.mcp_data = self.claude_dir / 'mcp' / 'data' / 'communication'
         self.logs_dir = self.claude_dir / 'logs'
         self.logs_dir.mkdir(exist_ok=True)
+        
+        # Shared tasks.json reader/writer
+        self.task_store = get_store(self.mcp_data / 'tasks.json')
     
     def start_pending_workflows(self) -> Dict:
         """Start workflows for all pending assigned tasks"""
@@ -45,21 +53,20 @@ class CoordinationStarter:
             
             results['total_tasks_processed'] = len(pending_tasks)
             
-            # Start workflows for each pending task
-            for task_id, task_data in pending_tasks.items():
-                success = self._start_task_workflow(task_id, task_data)
-                if success:
-                    results['started_workflows'].append({
-                        'task_id': task_id,
-                        'agent': task_data.get('assigned_to'),
-                        'title': task_data.get('title', 'Unknown')
-                    })
-                else:
-                    results['failed_workflows'].append({
+            # Start workflows for each pending task, writing tasks.json once
+            with self.task_store.batch():
+                for task_id, task_data in pending_tasks.items():
+                    # Capture before the workflow reassigns the (shared) task
+                    entry = {
                         'task_id': task_id,
                         'agent': task_data.get('assigned_to'),
                         'title': task_data.get('title', 'Unknown')
-                    })
+                    }
+                    success = self._start_task_workflow(task_id, task_data)
+                    if success:
+                        results['started_workflows'].append(entry)
+                    else:
+                        results['failed_workflows'].append(entry)
             
             self._log(f"Coordination starter processed {len(pending_tasks)} tasks")
             return results
@@ -274,51 +281,23 @@ class CoordinationStarter:
     def _load_tasks(self) -> Dict:
         """Load tasks from JSON file"""
         try:
-            tasks_file = self.mcp_data / 'tasks.json'
-            if not tasks_file.exists():
-                return {}
-            
-            with open(tasks_file, 'r') as f:
-                return json.load(f)
-        except Exception:
+            return self.task_store.load() or {}
+        except (OSError, json.JSONDecodeError) as e:
+            self._log(f"tasks.json read failed: {e!r}")
             return {}
     
     def _update_task_status(self, task_id: str, status: str):
         """Update task status"""
         try:
-            tasks_file = self.mcp_data / 'tasks.json'
-            if not tasks_file.exists():
-                return
-            
-            with open(tasks_file, 'r') as f:
-                tasks = json.load(f)
-            
-            if task_id in tasks:
-                tasks[task_id]['status'] = status
-                tasks[task_id]['updated_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')
-                
-                with open(tasks_file, 'w') as f:
-                    json.dump(tasks, f, indent=2)
-        except Exception as e:
+            self.task_store.update(task_id, status=status)
+        except (OSError, json.JSONDecodeError) as e:
             self._log(f"Error updating task status: {str(e)}")
     
     def _update_task_assignment(self, task_id: str, agent_name: str):
         """Update task assignment"""
         try:
-            tasks_file = self.mcp_data / 'tasks.json'
-            if not tasks_file.exists():
-                return
-            
-            with open(tasks_file, 'r') as f:
-                tasks = json.load(f)
-            
-            if task_id in tasks:
-                tasks[task_id]['assigned_to'] = agent_name
-                tasks[task_id]['updated_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')
-                
-                with open(tasks_file, 'w') as f:
-                    json.dump(tasks, f, indent=2)
-        except Exception as e:
+            self.task_store.update(task_id, assigned_to=agent_name)
+        except (OSError, json.JSONDecodeError) as e:
             self._log(f"Error updating task assignment: {str(e)}")
     
     def _log(self, message: str):
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Task Store
+Shared in-process reader/writer for the coordination tasks.json file
+"""
+
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+# Prefer orjson for tasks.json parsing/encoding when it is installed
+try:
+    import orjson
+    
+    def _load_file(f):
+        # Read into bytes rather than mmap: coord.py truncates tasks.json in place,
+        # which would SIGBUS a reader of the mapping. Revisit once every writer
+        # uses an atomic replace.
+        return orjson.loads(f.read())
+    
+    def _dumps(obj, pretty: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+except ImportError:
+    def _load_file(f):
+        return json.loads(f.read())
+    
+    def _dumps(obj, pretty: bool = False) -> bytes:
+        if pretty:
+            return json.dumps(obj, indent=2).encode()
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+def _stat_key(path: Path) -> Tuple[int, int, int]:
+    """Return the (mtime, size, inode) triple used to detect file changes"""
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+class TaskStore:
+    """Cached access to a tasks.json file with batched, atomic writes"""
+    
+    def __init__(self, tasks_file: Path):
+        self.tasks_file = tasks_file
+        
+        # Parsed tasks, reused while the file's (mtime, size, inode) is unchanged;
+        # size and inode catch os.replace writes within one coarse mtime tick
+        self._tasks: Optional[Dict] = None
+        self._stat_key: Optional[Tuple[int, int, int]] = None
+        
+        # Deferred writes (see batch); field updates not yet on disk, by task id
+        self._dirty = False
+        self._batch_depth = 0
+        self._pending: Dict[str, Dict] = {}
+    
+    def load(self) -> Optional[Dict]:
+        """Return parsed tasks, re-reading only when the file changed"""
+        try:
+            stat_key = _stat_key(self.tasks_file)
+        except FileNotFoundError:
+            # Keep unflushed changes rather than dropping them with the file
+            if not self._pending:
+                self._tasks = None
+            self._stat_key = None
+            return self._tasks
+        
+        if stat_key != self._stat_key:
+            with open(self.tasks_file, 'rb') as f:
+                tasks = _load_file(f)
+            # Another process wrote the file; carry our pending updates over
+            if tasks:
+                for task_id, fields in self._pending.items():
+                    if task_id in tasks:
+                        tasks[task_id].update(fields)
+            self._tasks = tasks
+            self._stat_key = stat_key
+        
+        return self._tasks
+    
+    def update(self, task_id: str, **fields) -> bool:
+        """Set fields on a task and save; returns False if the task is unknown"""
+        tasks = self.load()
+        if not tasks or task_id not in tasks:
+            return False
+        
+        # Skip the rewrite (and mtime bump) when nothing changes
+        task = tasks[task_id]
+        if all(task.get(key) == value for key, value in fields.items()):
+            return True
+        
+        fields['updated_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')
+        task.update(fields)
+        self._pending.setdefault(task_id, {}).update(fields)
+        self.save()
+        return True
+    
+    @contextmanager
+    def batch(self):
+        """Defer writes and flush them once on exit"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self.flush()
+    
+    def save(self):
+        """Write the cached tasks now, or at the end of the current batch"""
+        self._dirty = True
+        if self._batch_depth == 0:
+            self.flush()
+    
+    def flush(self):
+        """Write tasks.json and keep the cache valid"""
+        # Merge pending updates onto any newer copy on disk before writing
+        if self.load() is None:
+            self._pending.clear()
+            self._dirty = False
+            return
+        
+        # Force a re-read if the write fails part way
+        self._stat_key = None
+        # Write a sibling file and rename so readers never see partial JSON; the
+        # name is unique so concurrent writers never share a temp file
+        fd, tmp_file = tempfile.mkstemp(dir=self.tasks_file.parent, prefix=self.tasks_file.name + '.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                # mkstemp creates 0600; keep the mode readers of tasks.json expect
+                try:
+                    os.fchmod(fd, os.stat(self.tasks_file).st_mode & 0o777)
+                except FileNotFoundError:
+                    os.fchmod(fd, 0o644)
+                f.write(_dumps(self._tasks, pretty=os.environ.get('CLAUDE_PRETTY_TASKS') == '1'))
+            os.replace(tmp_file, self.tasks_file)
+        except BaseException:
+            try:
+                os.unlink(tmp_file)
+            except FileNotFoundError:
+                pass
+            raise
+        self._pending.clear()
+        self._dirty = False
+        self._stat_key = _stat_key(self.tasks_file)
+
+_stores: Dict[Path, TaskStore] = {}
+
+def get_store(tasks_file: Path) -> TaskStore:
+    """Return the process-wide store for a tasks.json path"""
+    key = Path(os.path.abspath(tasks_file))
+    store = _stores.get(key)
+    if store is None:
+        store = _stores[key] = TaskStore(key)
+    return store